@@ -0,0 +1,242 @@
+"""Per-chapter rerun cost of the app in both languages, driven headlessly with ``AppTest``.
+
+Run from the repository root:
+
+    python benchmarks/bench_apptest.py [--values 5] [--clear-cache] [--json apptest.json]
+    python benchmarks/bench_apptest.py --json new.json --compare old.json
+
+Each entry of ``--apps`` (``app.py?lang=fa`` opens the Persian catalog) is
+opened once; then every chapter page is visited and each of
+its sliders is swept over ``--values`` evenly spaced positions (and every
+in-page radio option is tried), one rerun per setting. For each rerun it
+records:
+
+* ``wall_ms`` — time of ``AppTest.run()``;
+* ``compute_ms`` — time inside ``physics.kernels``, ``physics.photons`` and
+  ``ui.raster`` (NumPy work and cache lookups);
+* ``figure_ms`` — time inside ``ui.figures`` builders;
+* ``figure_bytes`` — size of the Plotly JSON specs the page sends.
+
+Timing wraps each public function of those modules in place, counting only
+the outermost call, so nested helpers are not counted twice. The rest of
+``wall_ms`` is Streamlit itself (widgets, Markdown, chart serialization).
+With ``--clear-cache`` every rerun starts from an empty ``st.cache_data``,
+which measures cold compute instead of the cache hit a repeat visit gets.
+
+``--json`` writes every rerun plus a per-chapter summary and the commit and
+library versions. ``--compare`` prints the change in median rerun time and
+figure bytes against an earlier file and exits non-zero when any chapter's
+median rerun slowed by more than ``--tolerance``. Everything runs offline.
+"""
+import argparse
+import functools
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+APPS = ["app.py", "app.py?lang=fa"]
+
+
+class Profiler:
+    """Accumulates time per bucket for wrapped module functions, outermost call only."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self._depth = 0
+
+    def reset(self):
+        self.totals.clear()
+
+    def wrap(self, bucket, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if self._depth:
+                return fn(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.totals[bucket] += time.perf_counter() - start
+                self._depth -= 1
+        return timed
+
+    def instrument(self, bucket, module):
+        for name, obj in list(vars(module).items()):
+            if name.startswith("_") or inspect.isclass(obj) or not callable(obj):
+                continue
+            if getattr(obj, "__module__", None) == module.__name__:
+                setattr(module, name, self.wrap(bucket, obj))
+
+
+def slider_values(slider, count):
+    """``count`` evenly spaced positions of ``slider`` snapped to its step, in its own type."""
+    lo, hi, step = slider.min, slider.max, slider.step
+    cast = int if isinstance(lo, int) else float
+    values = []
+    for i in range(count):
+        raw = lo + (hi - lo) * i / max(count - 1, 1)
+        values.append(cast(min(hi, lo + round((raw - lo) / step) * step)))
+    return list(dict.fromkeys(values))
+
+
+def rerun(at, profiler, clear_cache, **labels):
+    import streamlit as st
+
+    if clear_cache:
+        st.cache_data.clear()
+    profiler.reset()
+    start = time.perf_counter()
+    at.run()
+    wall = time.perf_counter() - start
+    compute, figure = profiler.totals["compute"], profiler.totals["figure"]
+    charts = at.get("plotly_chart")
+    return dict(
+        labels,
+        wall_ms=wall * 1e3, compute_ms=compute * 1e3, figure_ms=figure * 1e3,
+        other_ms=(wall - compute - figure) * 1e3,
+        charts=len(charts), figure_bytes=sum(len(chart.proto.spec) for chart in charts),
+        error=[e.message for e in at.exception],
+    )
+
+
+def bench_app(app, profiler, n_values, clear_cache):
+    from streamlit.testing.v1 import AppTest
+
+    from ui import i18n
+
+    path, _, lang = app.partition("?lang=")
+    at = AppTest.from_file(str(ROOT / path), default_timeout=300)
+    if lang:
+        at.query_params["lang"] = lang
+    at.run()
+    rows = []
+    for chapter, key in i18n.CATALOGS[lang or i18n.DEFAULT]["chapters"].items():
+        at.switch_page(f"chapters/{key}.py")
+        rows.append(rerun(at, profiler, clear_cache, app=app, chapter=chapter, widget="(select)", value=None))
+        for k in range(len(at.main.slider)):
+            slider = at.main.slider[k]
+            label = slider.label
+            for value in slider_values(slider, n_values):
+                at.main.slider[k].set_value(value)
+                rows.append(rerun(at, profiler, clear_cache, app=app, chapter=chapter, widget=label, value=value))
+        for k in range(len(at.main.radio)):
+            radio = at.main.radio[k]
+            for option in radio.options:
+                at.main.radio[k].set_value(option)
+                rows.append(rerun(at, profiler, clear_cache, app=app, chapter=chapter,
+                                  widget=radio.label, value=option))
+            at.main.radio[k].set_value(radio.options[0])
+            at.run()
+    return rows
+
+
+def summarize(rows):
+    """Per (app, chapter): rerun count, median/max wall, median compute/figure/other, max figure bytes."""
+    groups = defaultdict(list)
+    for row in rows:
+        groups[f"{row['app']} :: {row['chapter']}"].append(row)
+    summary = {}
+    for key, group in groups.items():
+        median = lambda field: statistics.median(r[field] for r in group)  # noqa: E731
+        summary[key] = dict(
+            reruns=len(group),
+            wall_ms_median=median("wall_ms"), wall_ms_max=max(r["wall_ms"] for r in group),
+            compute_ms_median=median("compute_ms"), figure_ms_median=median("figure_ms"),
+            other_ms_median=median("other_ms"), figure_bytes_max=max(r["figure_bytes"] for r in group),
+            errors=sum(bool(r["error"]) for r in group),
+        )
+    return summary
+
+
+def environment():
+    import numpy
+    import plotly
+    import streamlit
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return dict(
+        commit=commit, timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        python=platform.python_version(), platform=platform.platform(), cpus=os.cpu_count(),
+        numpy=numpy.__version__, plotly=plotly.__version__, streamlit=streamlit.__version__,
+    )
+
+
+def print_summary(summary):
+    print(f"{'app :: chapter':<58} {'reruns':>6} {'wall':>7} {'max':>7} {'numpy':>7} {'figure':>7} "
+          f"{'other':>7} {'KiB':>7}")
+    for key, s in summary.items():
+        print(f"{key:<58} {s['reruns']:>6} {s['wall_ms_median']:>7.1f} {s['wall_ms_max']:>7.1f} "
+              f"{s['compute_ms_median']:>7.1f} {s['figure_ms_median']:>7.1f} {s['other_ms_median']:>7.1f} "
+              f"{s['figure_bytes_max'] / 1024:>7.1f}" + (f"  {s['errors']} errors" if s["errors"] else ""))
+    print("(times are per-rerun medians in ms, except max; KiB is the largest page's chart JSON)")
+
+
+def compare(summary, baseline, tolerance):
+    """Print median-wall and figure-size changes against ``baseline``; return the regressed keys."""
+    regressed = []
+    print(f"\n{'app :: chapter':<58} {'wall Δ':>8} {'bytes Δ':>8}")
+    for key, s in summary.items():
+        old = baseline.get(key)
+        if old is None:
+            print(f"{key:<58} {'new':>8}")
+            continue
+        wall = s["wall_ms_median"] / old["wall_ms_median"] - 1
+        size = s["figure_bytes_max"] / old["figure_bytes_max"] - 1 if old["figure_bytes_max"] else 0.0
+        flag = "  REGRESSION" if wall > tolerance else ""
+        print(f"{key:<58} {wall:>+8.0%} {size:>+8.0%}{flag}")
+        if flag:
+            regressed.append(key)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", nargs="+", default=APPS)
+    parser.add_argument("--values", type=int, default=5, help="positions per slider")
+    parser.add_argument("--clear-cache", action="store_true", help="empty st.cache_data before every rerun")
+    parser.add_argument("--json", help="write every rerun and the summary to this file")
+    parser.add_argument("--compare", help="an earlier --json file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slow-down of a chapter's median rerun")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    from physics import kernels, photons
+    from ui import figures, raster
+
+    profiler = Profiler()
+    for module in (kernels, photons, raster):
+        profiler.instrument("compute", module)
+    profiler.instrument("figure", figures)
+
+    rows = [row for app in args.apps for row in bench_app(app, profiler, args.values, args.clear_cache)]
+    summary = summarize(rows)
+    print_summary(summary)
+
+    if args.json:
+        result = dict(environment=environment(), options=vars(args), summary=summary, reruns=rows)
+        Path(args.json).write_text(json.dumps(result, indent=2, ensure_ascii=False))
+    regressed = []
+    if args.compare:
+        regressed = compare(summary, json.loads(Path(args.compare).read_text())["summary"], args.tolerance)
+    if regressed or any(s["errors"] for s in summary.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
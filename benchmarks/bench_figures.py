@@ -0,0 +1,140 @@
+"""Figure construction cost per rerun, before and after the cached skeletons.
+
+Run from the repository root:
+
+    python benchmarks/bench_figures.py [--repeat 200]
+
+"before" rebuilds each chapter's chart the way the apps originally did
+(``go.Figure`` + ``add_trace`` + ``update_layout``, all validated); "after"
+uses ``ui.figures`` skeletons. Both columns include the ``to_dict`` +
+``to_json`` that ``st.plotly_chart`` performs, since that is what a rerun
+pays. Kernel results are computed once up front so only figure work is timed.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+import plotly.graph_objs as go  # noqa: E402
+import plotly.io as pio  # noqa: E402
+import streamlit  # noqa: E402,F401  registers Streamlit's Plotly template, as in the app
+from plotly.subplots import make_subplots  # noqa: E402
+
+from physics import kernels  # noqa: E402
+from ui import figures  # noqa: E402
+
+DARK = dict(paper_bgcolor="#0b1a33", plot_bgcolor="#0b1a33", font=dict(color="#e6f2ff"))
+
+
+def chapters():
+    """Yield ``(name, before, after)`` builders for every chapter chart."""
+    v_frac, L0 = 0.7, 20.0
+    gamma, L = kernels.relativity(v_frac, L0)
+    t = np.linspace(0, 10.0, 200)
+    x_rest, x_moving = v_frac * t, L0 + v_frac * t
+    scene = kernels.spacetime_scene("twin", v_frac, L0, "moving", 2000)
+
+    def rel_before():
+        fig = make_subplots(rows=2, cols=1, row_heights=[0.4, 0.6])
+        fig.add_shape(type="rect", x0=0, x1=L0, y0=0, y1=1, fillcolor="#87ceeb", opacity=0.3, row=1, col=1)
+        fig.add_shape(type="rect", x0=5, x1=5 + L, y0=0, y1=1, fillcolor="#ff6b6b", opacity=0.3, row=1, col=1)
+        fig.add_trace(go.Scatter(x=x_rest, y=t, mode='lines', line=dict(color='#4a9eff')), row=2, col=1)
+        fig.add_trace(go.Scatter(x=x_moving, y=t, mode='lines', line=dict(color='#ff6b6b')), row=2, col=1)
+        fig.update_layout(height=700, **DARK)
+        return fig
+
+    def rel_after():
+        return figures.spacetime_diagram(scene, ("home", "traveller", "simultaneity", "events"))
+
+    yield "1 spacetime (2k ev)", rel_before, rel_after
+
+    freq, phi = 15.0, 2.2
+    E, Kmax, f_axis, K_curve = kernels.photoelectric(freq, phi)
+
+    def pe_before():
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=f_axis, y=K_curve, line=dict(color='#4a9eff')))
+        fig.add_trace(go.Scatter(x=[freq], y=[Kmax], mode='markers', marker=dict(size=12, color='red')))
+        fig.update_layout(height=500, **DARK)
+        return fig
+
+    def pe_after():
+        return figures.figure(
+            data=[figures.line(f_axis, K_curve, '#4a9eff'), figures.markers([freq], [Kmax], 'red')],
+            layout=figures.layout(500),
+        )
+
+    yield "2 photoelectric", pe_before, pe_after
+
+    x_mm, I = kernels.grating(0.5, 550, 1.0, N=2)
+
+    def ds_before():
+        fig = go.Figure(go.Scatter(x=x_mm, y=I, line=dict(color='#87cefa')))
+        fig.update_layout(height=500, **DARK)
+        return fig
+
+    def ds_after():
+        return figures.figure([figures.line(x_mm, I, '#87cefa')], figures.layout(500))
+
+    yield "3 double-slit", ds_before, ds_after
+
+    n1, n2 = 3, 2
+    levels = -13.6 / np.arange(1, 7)**2
+    colors = ["#ffd700" if n == n1 else ("#87cefa" if n == n2 else "#555") for n in range(1, len(levels) + 1)]
+    r1, dE, lam_nm, E1, E2 = kernels.bohr(n1, n2)
+    level_xy, line_xy, lines = kernels.hydrogen_diagram(6, 3)
+
+    def bohr_before():
+        fig = go.Figure()
+        for E, color in zip(levels, colors):
+            fig.add_trace(go.Scatter(x=[0, 1], y=[E, E], line=dict(color=color, width=5)))
+        fig.update_layout(height=500, yaxis_autorange="reversed", **DARK)
+        return fig
+
+    def bohr_after():
+        return figures.energy_diagram(level_xy, line_xy, 3, E1, E2, ["Lyman", "Balmer", "Paschen"])
+
+    yield "4 bohr", bohr_before, bohr_after
+
+    t, x, frames = kernels.box_evolution(1, 2, 0.7, n_frames=100)
+
+    def box_before():
+        fig = go.Figure(
+            data=[go.Scatter(x=x, y=frames[0], line=dict(color="#90ee90"))],
+            frames=[go.Frame(data=[go.Scatter(y=y)], name=f"{ti:.2f}") for y, ti in zip(frames, t)],
+        )
+        fig.update_layout(height=500, updatemenus=figures.animation_controls(), **DARK)
+        return fig
+
+    def box_after():
+        return figures.animated_line(x, frames, t, height=500)
+
+    yield "5 box (100 frames)", box_before, box_after
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'chapter':<20} {'before ms':>10} {'after ms':>9} {'speed-up':>9}")
+    for name, before, after in chapters():
+        repeat = max(1, args.repeat // 20) if "box" in name else args.repeat
+        serialize = lambda build: pio.to_json(build().to_dict(), validate=False)  # noqa: E731
+        b = per_call_ms(lambda: serialize(before), repeat)
+        a = per_call_ms(lambda: serialize(after), repeat)
+        print(f"{name:<20} {b:>10.2f} {a:>9.2f} {b / a:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
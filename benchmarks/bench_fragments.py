@@ -0,0 +1,99 @@
+"""Per-interaction cost of a slider move: full rerun versus fragment rerun.
+
+Run from the repository root:
+
+    python benchmarks/bench_fragments.py [--values 3] [--port 8599] [--json fragments.json]
+
+Starts ``streamlit run app.py`` headless and drives it over the websocket
+like a browser (see ``wsclient.py``). On every chapter page, each slider in
+the chapter panel is moved to ``--values`` positions twice: once as a full
+script rerun (what every slider did before the panels became
+``st.fragment``\\ s) and once as the fragment rerun the browser now sends.
+A warm-up pass first fills ``st.cache_data``, so both passes measure the
+same cache hits. For each move it records the round trip until
+``script_finished`` and the messages and bytes received over the websocket.
+"""
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import wsclient  # noqa: E402
+from ui import i18n  # noqa: E402
+
+
+def positions(slider, count):
+    values = []
+    for i in range(count):
+        raw = slider.min + (slider.max - slider.min) * i / max(count - 1, 1)
+        values.append(min(slider.max, slider.min + round((raw - slider.min) / slider.step) * slider.step))
+    return list(dict.fromkeys(values))
+
+
+def bench_chapter(session, key, n_values):
+    session.open(key)
+    sliders = {label: widget for label, (kind, widget, fragment_id) in session.widgets.items()
+               if kind == "slider" and fragment_id}
+    moves = [(label, value) for label, widget in sliders.items() for value in positions(widget, n_values)]
+    rows = []
+    for mode in ("warm-up", "full", "fragment"):
+        for label, value in moves:
+            result = session.set(label, value, fragment=mode != "full")
+            if mode != "warm-up":
+                rows.append(dict(result, chapter=key, widget=label, value=value, mode=mode))
+        session.open(key)
+    return rows
+
+
+def summarize(rows):
+    groups = defaultdict(lambda: defaultdict(list))
+    for row in rows:
+        groups[row["chapter"]][row["mode"]].append(row)
+    summary = {}
+    for chapter, modes in groups.items():
+        summary[chapter] = {
+            mode: dict(moves=len(group), ms_median=statistics.median(r["ms"] for r in group),
+                       bytes_median=statistics.median(r["bytes"] for r in group),
+                       messages_median=statistics.median(r["messages"] for r in group),
+                       errors=sum(r["errors"] for r in group))
+            for mode, group in modes.items()
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=3, help="positions per slider")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--json", help="write every move and the summary to this file")
+    args = parser.parse_args()
+
+    with wsclient.server("app.py", args.port):
+        session = wsclient.Session(args.port)
+        session.rerun()
+        rows = [row for key in i18n.CATALOGS[i18n.DEFAULT]["chapters"].values()
+                for row in bench_chapter(session, key, args.values)]
+        session.close()
+    summary = summarize(rows)
+
+    print(f"{'chapter':<14} {'moves':>5} {'full ms':>8} {'frag ms':>8} {'Δ':>6} "
+          f"{'full KiB':>9} {'frag KiB':>9} {'Δ':>6} {'msgs':>9}")
+    for chapter, s in summary.items():
+        full, frag = s["full"], s["fragment"]
+        print(f"{chapter:<14} {full['moves']:>5} {full['ms_median']:>8.1f} {frag['ms_median']:>8.1f} "
+              f"{frag['ms_median'] / full['ms_median'] - 1:>+6.0%} {full['bytes_median'] / 1024:>9.1f} "
+              f"{frag['bytes_median'] / 1024:>9.1f} {frag['bytes_median'] / full['bytes_median'] - 1:>+6.0%} "
+              f"{full['messages_median']:>4.0f}→{frag['messages_median']:<4.0f}")
+    print("(medians per slider move; KiB and msgs are what the server sent over the websocket)")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(dict(options=vars(args), summary=summary, moves=rows), indent=2))
+    if any(m["errors"] for s in summary.values() for m in s.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Concurrent-session load test: rerun latency, throughput and server memory as sessions grow.
+
+Run from the repository root:
+
+    python benchmarks/bench_load.py [--sessions 1 4 16 32] [--duration 20] [--think 0.5]
+                                    [--port 8599] [--seed 0] [--json load.json]
+
+Starts ``streamlit run app.py`` headless on localhost (no network needed)
+and, for each level in ``--sessions``, opens that many websocket sessions
+(see ``wsclient.py``) that behave like students in a lab:
+
+* each session opens a random chapter and moves the chapter panel's sliders
+  as the browser does, one fragment rerun per release;
+* a slider walks a random path: it keeps its direction for a while and jumps
+  a few steps at a time, with a pause of mean ``--think`` seconds between
+  moves (exponentially distributed, so sessions drift out of step);
+* now and then (``--switch``) a session moves on to another chapter.
+
+A warm-up session first visits every chapter once, so the levels measure a
+running server rather than first imports. Latency is the round trip of one
+slider move until ``script_finished``; throughput is completed moves per
+second across all sessions (``--think 0`` turns the level into a saturation
+test of the single server process). Server RSS (``VmRSS`` from ``/proc``, Linux
+only) is sampled every 100 ms; the table shows the peak during the level.
+Exits non-zero if any rerun raised an exception.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import wsclient  # noqa: E402
+from ui import i18n  # noqa: E402
+
+
+def rss_mib(pid):
+    """Resident set size of ``pid`` in MiB, or None where ``/proc`` is unavailable."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Sampler(threading.Thread):
+    """Polls the server's RSS in the background; ``peak`` is the highest reading since ``reset()``."""
+
+    def __init__(self, pid, interval=0.1):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = None
+        self._done = threading.Event()
+
+    def reset(self):
+        self.peak = rss_mib(self.pid)
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            rss = rss_mib(self.pid)
+            if rss is not None and (self.peak is None or rss > self.peak):
+                self.peak = rss
+
+    def stop(self):
+        self._done.set()
+
+
+class Walk:
+    """A slider's random path: runs of a few jumps in one direction, reversing at the ends."""
+
+    def __init__(self, widget, rng):
+        self.widget = widget
+        self.rng = rng
+        self.value = widget.value[0] if widget.value else widget.default[0]
+        self.direction = rng.choice((-1, 1))
+
+    def next(self):
+        w = self.widget
+        if self.rng.random() < 0.3:
+            self.direction = -self.direction
+        steps = max(1, round(self.rng.expovariate(1 / 3)))
+        value = self.value + self.direction * steps * w.step
+        if not w.min <= value <= w.max:
+            self.direction = -self.direction
+            value = min(w.max, max(w.min, value))
+        # Snap to the slider's grid the way the frontend does, so integer sliders stay integers.
+        self.value = w.min + round((value - w.min) / w.step) * w.step
+        return self.value
+
+
+def student(port, chapters, deadline, args, rng, results, lock):
+    """One session: open a chapter, move its sliders until ``deadline``, switch chapters now and then."""
+    moves, errors = [], 0
+    session = None
+    try:
+        session = wsclient.Session(port)
+        session.rerun()
+        walks = {}
+        while time.monotonic() < deadline:
+            if not walks or rng.random() < args.switch:
+                errors += session.open(rng.choice(chapters))["errors"]
+                walks = {label: Walk(widget, rng) for label, (kind, widget, fragment_id) in session.widgets.items()
+                         if kind == "slider" and fragment_id and widget.max > widget.min}
+                continue
+            time.sleep(rng.expovariate(1 / args.think) if args.think > 0 else 0)
+            if time.monotonic() >= deadline:
+                break
+            label = rng.choice(list(walks))
+            result = session.set(label, walks[label].next())
+            moves.append(result["ms"])
+            errors += result["errors"]
+    except Exception as exc:  # a dropped connection counts against the level instead of aborting it
+        errors += 1
+        print(f"session error: {exc!r}", file=sys.stderr)
+    finally:
+        if session is not None:
+            session.close()
+    with lock:
+        results["moves"].extend(moves)
+        results["errors"] += errors
+
+
+def percentile(values, p):
+    if not values:
+        return float("nan")
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+def run_level(port, chapters, n, args, sampler):
+    results, lock = dict(moves=[], errors=0), threading.Lock()
+    deadline = time.monotonic() + args.duration
+    sampler.reset()
+    threads = [threading.Thread(target=student, args=(port, chapters, deadline, args,
+                                                      random.Random(f"{args.seed}-{n}-{i}"), results, lock))
+               for i in range(n)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+    ms = results["moves"]
+    return dict(sessions=n, moves=len(ms), seconds=elapsed, moves_per_s=len(ms) / elapsed,
+                p50_ms=percentile(ms, 50), p95_ms=percentile(ms, 95), p99_ms=percentile(ms, 99),
+                max_ms=max(ms, default=float("nan")), errors=results["errors"], rss_peak_mib=sampler.peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16, 32], help="concurrent sessions per level")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per level")
+    parser.add_argument("--think", type=float, default=0.5, help="mean pause between moves in seconds (0: none)")
+    parser.add_argument("--switch", type=float, default=0.05, help="chance per move of opening another chapter")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the options and per-level results to this file")
+    args = parser.parse_args()
+
+    keys = list(i18n.CATALOGS[i18n.DEFAULT]["chapters"].values())
+    with wsclient.server("app.py", args.port) as proc:
+        warm = wsclient.Session(args.port)
+        warm.rerun()
+        chapters = []
+        for key in keys:
+            warm.open(key)
+            if any(kind == "slider" and fragment_id for kind, _, fragment_id in warm.widgets.values()):
+                chapters.append(key)
+        warm.close()
+
+        sampler = Sampler(proc.pid)
+        sampler.start()
+        print(f"chapters: {', '.join(chapters)}; idle RSS {rss_mib(proc.pid) or float('nan'):.0f} MiB")
+        print(f"{'sessions':>8} {'moves':>6} {'moves/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'max ms':>8} {'errors':>6} {'RSS MiB':>8}")
+        levels = []
+        for n in args.sessions:
+            level = run_level(args.port, chapters, n, args, sampler)
+            levels.append(level)
+            print(f"{n:>8} {level['moves']:>6} {level['moves_per_s']:>8.1f} {level['p50_ms']:>8.1f} "
+                  f"{level['p95_ms']:>8.1f} {level['p99_ms']:>8.1f} {level['max_ms']:>8.1f} {level['errors']:>6} "
+                  f"{level['rss_peak_mib'] or float('nan'):>8.0f}")
+        sampler.stop()
+    print("(latency per slider move until script_finished; RSS is the server's peak during the level)")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(dict(options=vars(args), chapters=chapters, levels=levels), indent=2))
+    if any(level["errors"] for level in levels):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Step cost and accuracy checks for the split-operator Schrödinger solver.
+
+Run from the repository root:
+
+    python benchmarks/bench_schrodinger.py [--frames 100] [--steps 20]
+
+Times one step of ``schrodinger.evolve`` for several grid sizes, then checks
+that (1) the norm is conserved in every preset potential and (2) with V = 0
+the solver reproduces ``spectral.evolve``, the analytic infinite-well result.
+Exits non-zero if a check fails.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from physics import schrodinger, spectral  # noqa: E402
+
+NORM_TOL = 1e-9
+ANALYTIC_TOL = 1e-9
+
+
+def packet(n_x, x0=0.3, sigma=0.05, n0=12):
+    x = np.linspace(0, 1, n_x)
+    return x, spectral.gaussian_wavefunction(x, x0, sigma, n0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=20, help="steps per frame")
+    parser.add_argument("--nx", type=int, nargs="+", default=[500, 513, 1025, 4097])
+    args = parser.parse_args()
+    dt = 2 * spectral.classical_period(12) / ((args.frames - 1) * args.steps)
+
+    print(f"{'n_x':>6} {'µs/step':>9}")
+    for n_x in args.nx:
+        x, psi0 = packet(n_x)
+        start = time.perf_counter()
+        for _ in schrodinger.evolve(psi0, np.zeros(n_x), dt, args.frames, args.steps):
+            pass
+        print(f"{n_x:>6} {(time.perf_counter() - start) / ((args.frames - 1) * args.steps) * 1e6:>9.1f}")
+
+    failed = False
+    x, psi0 = packet(513)
+    samples = (0, 0, 1, 0, 0.5, 0, 0)
+    for kind in schrodinger.POTENTIALS:
+        V = schrodinger.potential(kind, x, 300, 0.1, samples)
+        drift = max(abs(schrodinger.norm(psi, x) - 1)
+                    for _, psi in schrodinger.evolve(psi0, V, dt, args.frames, args.steps))
+        failed |= drift > NORM_TOL
+        print(f"norm drift {kind:<12} {drift:.1e} {'ok' if drift <= NORM_TOL else 'FAIL'}")
+
+    # The analytic reference expands the packet in the well's eigenstates on the same grid.
+    n_x = 500
+    x, _, basis = spectral.eigenbasis(80, n_x)
+    coeffs = spectral.gaussian_packet(0.3, 0.05, 12, 80, n_x)
+    t, psi = zip(*schrodinger.evolve(coeffs @ basis, np.zeros(n_x), dt, args.frames, args.steps))
+    numeric = np.abs(np.array(psi))**2
+    _, analytic = spectral.evolve(coeffs, np.array(t), n_x)
+    error = np.abs(numeric - analytic).max() / analytic.max()
+    failed |= error > ANALYTIC_TOL
+    print(f"infinite well vs spectral.evolve: max rel. error {error:.1e} {'ok' if error <= ANALYTIC_TOL else 'FAIL'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Per-frame cost of the spectral engine as the number of eigenstates grows.
+
+Run from the repository root:
+
+    python benchmarks/bench_spectral.py [--frames 100] [--nx 500]
+
+For each state count N it times ``spectral.evolve`` over a batch of frames
+(basis already cached, as in the running app) next to the per-step loop the
+original chapter 5 used, where every frame re-evaluates ``np.sin`` for every
+state.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from physics import spectral  # noqa: E402
+
+
+def naive(coeffs, t, n_x, L=1.0):
+    x = np.linspace(0, L, n_x)
+    frames = []
+    for ti in t:
+        psi = np.zeros(n_x, dtype=complex)
+        for n, cn in enumerate(coeffs, start=1):
+            psi += cn * np.sqrt(2 / L) * np.sin(n * np.pi * x / L) * np.exp(-1j * n**2 * ti)
+        frames.append(np.abs(psi)**2)
+    return x, np.array(frames)
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--nx", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--states", type=int, nargs="+", default=[2, 5, 10, 20, 50, 100, 200])
+    args = parser.parse_args()
+
+    t = np.linspace(0, 4, args.frames)
+    print(f"frames={args.frames} n_x={args.nx} (best of {args.repeat})")
+    print(f"{'N':>5} {'engine µs/frame':>16} {'loop µs/frame':>14} {'speed-up':>9}")
+    for n_states in args.states:
+        coeffs = spectral.gaussian_packet(0.3, 0.05, n_states // 2, n_states, args.nx)
+        spectral.eigenbasis(n_states, args.nx)  # warm the basis cache like the app does
+        engine = best_of(lambda: spectral.evolve(coeffs, t, args.nx), args.repeat) / args.frames
+        loop = best_of(lambda: naive(coeffs, t, args.nx), max(1, args.repeat // 2)) / args.frames
+        print(f"{n_states:>5} {engine * 1e6:>16.1f} {loop * 1e6:>14.1f} {loop / engine:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Cold-start budget: import time per module and time to first render per app.
+
+Run from the repository root:
+
+    python benchmarks/startup.py [--top 15] [--budget-ms 1500] [--json startup.json]
+
+Two measurements, each in a fresh interpreter so nothing is already imported:
+
+* ``-X importtime`` for each app script (run bare, outside a Streamlit
+  server). The cumulative time of every top-level package is reported, so a
+  heavy import that sneaks back to module top shows up immediately.
+* Time to first render with ``streamlit.testing.v1.AppTest``: the first run of
+  the app (the Introduction), then the first visit of every chapter in the
+  same process, which is where the deferred imports are now paid.
+
+Exits non-zero when an app's first render exceeds ``--budget-ms``.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# One app serves both languages; "?lang=" picks the session's language as it does in a URL.
+APPS = ["app.py", "app.py?lang=fa"]
+
+_RENDER = r"""
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+import_s = time.perf_counter() - start
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+if sys.argv[2]:
+    at.query_params["lang"] = sys.argv[2]
+start = time.perf_counter()
+at.run()
+first_s = time.perf_counter() - start
+from ui import i18n
+chapters = {}
+for label, key in list(i18n.CATALOGS[sys.argv[2] or i18n.DEFAULT]["chapters"].items())[1:]:
+    start = time.perf_counter()
+    at.switch_page(f"chapters/{key}.py").run()
+    chapters[label] = time.perf_counter() - start
+print(json.dumps(dict(streamlit_import_s=import_s, first_render_s=first_s, chapters=chapters,
+                      error=[e.message for e in at.exception])))
+"""
+
+
+def _env():
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONWARNINGS="ignore")
+    env.pop("PYTHONIMPORTTIME", None)
+    return env
+
+
+def import_times(app):
+    """Return ``{top_level_package: cumulative_ms}`` from ``python -X importtime app``."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", app], cwd=ROOT, env=_env(),
+                          capture_output=True, text=True)
+    totals = defaultdict(float)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only top-level entries (no indentation) carry the full cost of a package.
+        if name.startswith(" ") and not name[1:].startswith(" "):
+            totals[name.strip()] += int(cumulative) / 1000
+    return dict(totals)
+
+
+def first_render(app):
+    path, _, lang = app.partition("?lang=")
+    proc = subprocess.run([sys.executable, "-c", _RENDER, str(ROOT / path), lang], cwd=ROOT, env=_env(),
+                          capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", nargs="+", default=APPS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=1500.0,
+                        help="maximum time to first render per app")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results, over = {}, []
+    for app in args.apps:
+        imports = import_times(app.partition("?")[0])
+        render = first_render(app)
+        results[app] = dict(imports_ms=imports, **render)
+
+        print(f"\n== {app}")
+        print(f"{'module':<32} {'cumulative ms':>14}")
+        for name, ms in sorted(imports.items(), key=lambda kv: -kv[1])[:args.top]:
+            print(f"{name:<32} {ms:>14.1f}")
+        first_ms = render["first_render_s"] * 1000
+        print(f"\nstreamlit.testing import   {render['streamlit_import_s'] * 1000:8.1f} ms")
+        print(f"time to first render       {first_ms:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+        for chapter, s in render["chapters"].items():
+            print(f"  first visit {chapter:<28} {s * 1000:8.1f} ms")
+        if render["error"]:
+            print("  app raised:", *render["error"], sep="\n    ")
+        if first_ms > args.budget_ms or render["error"]:
+            over.append(app)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    if over:
+        print("\nover budget:", ", ".join(over))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""A minimal Streamlit browser stand-in speaking the websocket protocol.
+
+It sends ``BackMsg.rerun_script`` messages the way the frontend does and
+reads ``ForwardMsg`` replies until ``script_finished``, counting messages and
+bytes on the wire. Like the browser, it reports the hashes of cacheable
+messages it has already received, so unchanged large elements come back as
+short references. Widgets are addressed by label; a change can be sent as a
+full rerun or, for a widget inside an ``st.fragment``, as a fragment rerun.
+
+Uses the ``websockets`` package (installed with Streamlit's server) and
+Streamlit's own protobuf classes, so it follows the installed version.
+"""
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@contextmanager
+def server(app="app.py", port=8599, timeout=60):
+    """Run ``streamlit run app`` headless on ``port`` for the duration of the block; yields the Popen."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app, "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false", "--server.fileWatcherType", "none"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as r:
+                    if r.status == 200:
+                        break
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"streamlit did not start on port {port}")
+                time.sleep(0.2)
+        yield proc
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+class Session:
+    """One browser tab: a websocket, the current page, and the widgets it last saw."""
+
+    def __init__(self, port=8599, query_string=""):
+        self.ws = connect(f"ws://localhost:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+        self.query_string = query_string
+        self.page_hash = ""
+        self.pages = {}
+        self.widgets = {}
+        self.states = {}
+        self.cached = set()
+
+    def close(self):
+        self.ws.close()
+
+    def rerun(self, fragment_id=""):
+        """Send one rerun and read until the script finishes.
+
+        Returns ``dict(ms, messages, bytes, elements, errors)``.
+        """
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = self.query_string
+        state.page_script_hash = self.page_hash
+        state.fragment_id = fragment_id
+        state.widget_states.widgets.extend(self.states.values())
+        state.cached_message_hashes.extend(self.cached)
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        n_msgs = n_bytes = elements = errors = 0
+        while True:
+            raw = self.ws.recv()
+            n_msgs += 1
+            n_bytes += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if fwd.metadata.cacheable:
+                self.cached.add(fwd.hash)
+            if kind == "navigation":
+                self.pages = {p.url_pathname: p.page_script_hash for p in fwd.navigation.app_pages}
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                elements += 1
+                self._see(fwd.delta.new_element, fwd.delta.fragment_id)
+                errors += fwd.delta.new_element.WhichOneof("type") == "exception"
+            elif kind == "script_finished":
+                break
+        return dict(ms=(time.perf_counter() - start) * 1e3, messages=n_msgs, bytes=n_bytes,
+                    elements=elements, errors=errors)
+
+    def _see(self, element, fragment_id):
+        kind = element.WhichOneof("type")
+        if kind in ("slider", "radio", "selectbox"):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = (kind, widget, fragment_id)
+
+    def open(self, url_pathname=""):
+        """Navigate to a page by its url path ('' is the default page)."""
+        self.page_hash = self.pages.get(url_pathname, "")
+        self.widgets.clear()
+        self.states.clear()
+        return self.rerun()
+
+    def set(self, label, value, fragment=True):
+        """Set a slider to ``value`` (or a radio/selectbox to the option ``value``) and rerun.
+
+        With ``fragment`` the rerun is limited to the widget's fragment, as the
+        browser does; otherwise the whole script reruns.
+        """
+        kind, widget, fragment_id = self.widgets[label]
+        state = self.states.setdefault(widget.id, WidgetState(id=widget.id))
+        if kind == "slider":
+            state.double_array_value.data[:] = [value]
+        else:
+            state.string_value = value
+        return self.rerun(fragment_id if fragment else "")
@@ -0,0 +1,40 @@
+# 4. Bohr Model
+import streamlit as st
+
+from physics import hydrogen, kernels
+from ui import figures, i18n, page
+
+T = i18n.strings()
+page.lesson(T, "bohr")
+page.equations(T, "bohr")
+
+
+def series_name(n_f):
+    return T["bohr.series"].get(n_f) or hydrogen.series_name(n_f)
+
+
+@page.panel("bohr")
+def panel():
+    col1, col2 = st.columns(2)
+    with col1:
+        n_max = st.slider(T["bohr.n_max"], 6, 300, 6)
+        n_f_max = st.slider(T["bohr.n_f_max"], 1, 6, 3)
+    with col2:
+        n1 = st.slider(T["bohr.n1"], 1, n_max, 3)
+        n2 = st.slider(T["bohr.n2"], 1, n_max, 2)
+    r1, dE, lam_nm, E1, E2 = kernels.bohr(n1, n2)
+    level_xy, line_xy, lines = kernels.hydrogen_diagram(n_max, n_f_max)
+    if n1 == n2:
+        photon = T["bohr.no_transition"]
+    else:
+        kind = T["bohr.emission"] if n1 > n2 else T["bohr.absorption"]
+        photon = T["bohr.photon"].format(var=page.VAR, lam_nm=lam_nm, series=series_name(min(n1, n2)), kind=kind)
+    page.result(T, T["bohr.result"].format(var=page.VAR, r=r1, dE=dE, photon=photon))
+    st.caption(T["bohr.lines"].format(n_lines=len(lines[0]), n_max=n_max))
+
+    fig = figures.energy_diagram(level_xy, line_xy, n_f_max, E1, E2,
+                                 [series_name(k) for k in range(1, n_f_max + 1)])
+    page.chart(fig)
+
+
+panel()
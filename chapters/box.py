@@ -0,0 +1,60 @@
+# 5. Particle in a Box
+import streamlit as st
+
+from physics import kernels
+from ui import figures, i18n, page
+
+T = i18n.strings()
+page.lesson(T, "box")
+page.equations(T, "box")
+
+
+@page.panel("box")
+def panel():
+    POTENTIALS, MODES = T["box.potentials"], T["box.modes"]
+    col1, col2 = st.columns([0.6, 0.4])
+    with col1:
+        mode = MODES[st.radio(T["box.mode"], list(MODES), horizontal=True)]
+        if mode == "superposition":
+            n1 = st.slider(T["box.n1"], 1, 5, 1)
+            n2 = st.slider(T["box.n2"], 1, 5, 2)
+            amp = st.slider(T["box.amp"], 0.0, 1.0, 0.7, 0.05)
+        else:
+            x0 = st.slider(T["box.x0"], 0.1, 0.9, 0.3, 0.05)
+            sigma = st.slider(T["box.sigma"], 0.02, 0.2, 0.05, 0.01)
+            n0 = st.slider(T["box.n0"], 0, 30, 12)
+            if mode == "packet":
+                n_states = st.slider(T["box.n_states"], 10, 80, 60, 5)
+    with col2:
+        if mode == "packet":
+            st.info(T["box.packet_info"])
+        elif mode == "potential":
+            kind = POTENTIALS[st.selectbox(T["box.potential"], list(POTENTIALS))]
+            V0 = st.slider(T["box.V0"], 0, 1000, 200, 10)
+            width, samples = 0.2, None
+            if kind == "custom":
+                shape = st.text_input(T["box.shape"], "0, 0, 1, 0, 0.5, 0, 0")
+                try:
+                    samples = tuple(float(v) for v in shape.split(","))
+                except ValueError:
+                    st.error(T["box.shape_error"])
+                    samples = (0.0,)
+            elif kind in ("finite_well", "barrier"):
+                width = st.slider(T["box.width"], 0.02, 0.6, 0.2, 0.01)
+            st.info(T["box.potential_info"].format(E0=n0**2))
+
+    # All frames ship in one figure; the browser plays them with the chart's own controls.
+    background = ()
+    if mode == "superposition":
+        t, x, frames = kernels.box_evolution(n1, n2, amp, n_frames=100)
+    elif mode == "packet":
+        t, x, frames = kernels.packet_evolution(x0, sigma, n0, n_states, n_frames=100)
+    else:
+        t, x, frames, V = kernels.potential_evolution(kind, V0, x0, sigma, n0, width, samples, n_frames=100)
+        background = [figures.line(x, V / max(V.max(), 1e-12), "#888", width=1, showlegend=False)]
+    fig = figures.animated_line(x, frames, t, play_label=T["box.play"], pause_label=T["box.pause"],
+                                height=500, background=background)
+    page.chart(fig)
+
+
+panel()
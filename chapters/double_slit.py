@@ -0,0 +1,53 @@
+# 3. Double-Slit Interference
+import streamlit as st
+
+from physics import kernels, photons
+from ui import figures, i18n, page, raster
+
+T = i18n.strings()
+page.lesson(T, "ds")
+page.equations(T, "ds")
+
+
+@page.panel("double_slit")
+def panel():
+    SOURCES, VIEWS = T["ds.sources"], T["ds.views"]
+    col1, col2 = st.columns(2)
+    with col1:
+        d_mm = st.slider(T["ds.d"], 0.1, 2.0, 0.5, 0.01)
+        lam_nm = st.slider(T["ds.lam"], 400, 700, 550, 10)
+        L = st.slider(T["ds.L"], 0.5, 5.0, 1.0, 0.1)
+    with col2:
+        N = st.slider(T["ds.N"], 2, 20, 2)
+        a_um = st.slider(T["ds.a"], 0, 200, 0, 5)
+        source = SOURCES[st.selectbox(T["ds.source"], list(SOURCES))]
+        h_um = st.slider(T["ds.h"], 50, 500, 100, 10)
+    mode = VIEWS[st.radio(T["ds.view"], list(VIEWS), horizontal=True)]
+    if mode == "wave":
+        x_mm, I = kernels.grating(d_mm, lam_nm, L, a_um, N, source)
+        fig = figures.figure([figures.line(x_mm, I, '#87cefa')], figures.layout(500))
+        page.chart(fig)
+
+        # The 2D screen is rendered server-side to one small image, cached per parameter set
+        screen = raster.interference_screen(d_mm, lam_nm, L, a_um, N, source, h_um)
+        st.caption(T["ds.screen"])
+        page.chart(figures.image_figure(screen, -50, 50, -10, 10, height=300, xaxis_title="x (mm)", yaxis_title="y (mm)"))
+    else:
+        # Hits accumulate in this session until a slider changes; each batch only samples its own photons.
+        key = (d_mm, lam_nm, L, a_um, N, source)
+        if st.session_state.get("photons", {}).get("key") != key:
+            st.session_state["photons"] = photons.new_screen(key)
+        cdf = kernels.photon_cdf(*key)
+        cols = st.columns(len(photons.BATCHES) + 1)
+        for col, n in zip(cols, photons.BATCHES):
+            if col.button(f"+{n:,}"):
+                photons.detect(st.session_state["photons"], cdf, -50, 50, n)
+        if cols[-1].button(T["ds.reset"]):
+            st.session_state["photons"] = photons.new_screen(key)
+        screen = st.session_state["photons"]
+        st.caption(T["ds.detected"].format(total=screen["total"]))
+        expected = screen["total"] * photons.bin_probabilities(cdf, len(screen["counts"]))
+        page.chart(figures.photon_build_up(-50, 50, screen["counts"], expected, screen["last"]))
+
+
+panel()
@@ -0,0 +1,6 @@
+# Key Equations
+from ui import i18n, page
+
+T = i18n.strings()
+page.title(T["eq.title"])
+page.equations(T, "eq")
@@ -0,0 +1,9 @@
+# Introduction
+import streamlit as st
+
+from ui import i18n, page
+
+T = i18n.strings()
+page.title(T["intro.title"], center=True)
+# The Persian poem in a Nastaliq-style face, the body box and the credits
+st.markdown(page.intro_html(T), unsafe_allow_html=True)
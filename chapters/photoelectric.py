@@ -0,0 +1,34 @@
+# 2. Photoelectric Effect
+import streamlit as st
+
+from physics import kernels
+from ui import figures, i18n, page
+
+T = i18n.strings()
+page.lesson(T, "pe")
+page.equations(T, "pe")
+
+
+@page.panel("photoelectric")
+def panel():
+    freq_1e14 = st.slider(T["pe.freq"], 1.0, 100.0, 15.0, 0.5)
+    phi = st.slider(T["pe.phi"], 1.0, 5.0, 2.2, 0.1)
+    E, Kmax, f_axis, K_curve = kernels.photoelectric(freq_1e14, phi)
+    page.result(T, T["pe.result"].format(var=page.VAR, E=E, Kmax=Kmax))
+    if E > phi: st.success(T["pe.emitted"])
+    else: st.error(T["pe.below"])
+
+    fig = figures.figure(
+        data=[figures.line(f_axis, K_curve, '#4a9eff'), figures.markers([freq_1e14], [Kmax], 'red')],
+        layout=figures.layout(500),
+    )
+    page.chart(fig)
+
+    # Photocurrent from a seeded Monte Carlo exposure: intensity sets the current, frequency the stopping potential
+    power_nW = st.slider(T["pe.power"], 0.1, 10.0, 1.0, 0.1)
+    V, I_pA, n_photons, n_emitted, V_stop = kernels.photocurrent(freq_1e14, phi, power_nW)
+    st.caption(T["pe.photocurrent"].format(n_photons=n_photons, n_emitted=n_emitted, V_stop=V_stop, Kmax=Kmax))
+    page.chart(figures.iv_curve(V, I_pA, -Kmax))
+
+
+panel()
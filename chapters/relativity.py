@@ -0,0 +1,45 @@
+# 1. Special Relativity
+import streamlit as st
+
+from physics import kernels, spacetime
+from ui import figures, i18n, page
+
+T = i18n.strings()
+page.lesson(T, "rel", "key_equations")
+page.equations(T, "rel")
+
+
+@page.panel("relativity")
+def panel():
+    PRESETS, FRAMES = T["rel.presets"], T["rel.frames"]
+    col1, col2 = st.columns([0.55, 0.45])
+    with col1:
+        v_frac = st.slider(T["rel.v"], 0.0, 0.99, 0.7, 0.01)
+        L0 = st.number_input(T["rel.L0"], 1.0, 100.0, 20.0)
+        gamma, L = kernels.relativity(v_frac, L0)
+        page.result(T, T["rel.result"].format(var=page.VAR, gamma=gamma, L=L))
+
+    with col2:
+        if v_frac < 0.3: st.info(T["rel.negligible"])
+        elif v_frac < 0.7: st.warning(T["rel.significant"])
+        else: st.error(T["rel.near_c"])
+        preset = PRESETS[st.selectbox(T["rel.scenario"], list(PRESETS))]
+        frame = FRAMES[st.radio(T["rel.draw_in"], list(FRAMES), horizontal=True)]
+        n_events = st.slider(T["rel.events"], 0, 5000, 2000, 500)
+
+    scene = kernels.spacetime_scene(preset, v_frac, L0, frame, n_events)
+    names = T[f"rel.{preset}.names"]
+    if preset == "rod":
+        st.caption(T["rel.rod.caption"].format(L=L))
+    elif preset == "ladder":
+        barn = spacetime.BARN_RATIO * L0
+        fits = T["rel.ladder.fits"] if L <= barn else T["rel.ladder.does_not_fit"]
+        st.caption(T["rel.ladder.caption"].format(barn=barn, L=L, fits=fits, barn_moving=barn / gamma))
+    else:
+        st.caption(T["rel.twin.caption"].format(home=2 * L0, traveller=2 * L0 / gamma))
+    st.caption(T["rel.ticks"].format(step=scene["step"]))
+    fig = figures.spacetime_diagram(scene, names + (T["rel.simultaneity"], T["rel.key_events"]))
+    page.chart(fig)
+
+
+panel()
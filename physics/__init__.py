@@ -0,0 +1 @@
+"""Physics kernels behind every chapter of the simulator, in either language."""
@@ -0,0 +1,19 @@
+"""Approximate sRGB colour of visible wavelengths (Bruton's piecewise-linear fit)."""
+import numpy as np
+
+
+def wavelength_to_rgb(lam_nm):
+    """Return RGB in [0, 1], shaped ``lam_nm.shape + (3,)``; black outside 380–780 nm.
+
+    Intensity falls off towards both ends of the visible range, where the
+    eye is less sensitive.
+    """
+    lam = np.asarray(lam_nm, dtype=float)
+    r = np.select([lam < 440, lam < 490, lam < 510, lam < 580, lam <= 780],
+                  [(440 - lam) / 60, 0, 0, (lam - 510) / 70, 1], 0)
+    g = np.select([lam < 440, lam < 490, lam < 580, lam < 645],
+                  [0, (lam - 440) / 50, 1, (645 - lam) / 65], 0)
+    b = np.select([lam < 490, lam < 510], [1, (510 - lam) / 20], 0)
+    fade = np.select([lam < 380, lam < 420, lam <= 700, lam <= 780],
+                     [0, 0.3 + 0.7 * (lam - 380) / 40, 1, 0.3 + 0.7 * (780 - lam) / 80], 0)
+    return np.clip(np.stack([r, g, b], axis=-1) * fade[..., None], 0, 1)
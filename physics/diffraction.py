@@ -0,0 +1,75 @@
+"""Finite-width N-slit diffraction with polychromatic sources.
+
+For slits of width ``a`` spaced ``d`` apart, at screen position x a distance
+L away (sin θ = x / √(x² + L²)):
+
+    I(λ, x) = sinc²(a sinθ / λ) · [sin(Nγ) / (N sin γ)]²,   γ = π d sinθ / λ
+
+The first factor is the single-slit envelope, the second the N-slit
+interference term (cos²γ for N = 2, the original chapter 3 pattern). A
+source is a set of wavelengths with weights; the screen intensity is their
+weighted sum, evaluated as one (wavelength × x) broadcast.
+"""
+import numpy as np
+
+from physics import sampling
+from physics.color import wavelength_to_rgb
+
+# Sources offered in the chapter; weights are relative intensities.
+SOURCES = ("mono", "white", "sodium", "hydrogen")
+_LINES = {
+    "sodium": ([589.0, 589.6], [1.0, 0.5]),
+    "hydrogen": ([656.3, 486.1, 434.0, 410.2], [1.0, 0.35, 0.18, 0.1]),
+}
+
+
+def spectrum(source, lam_nm=550, n_samples=240):
+    """Return ``(wavelengths_nm, weights)`` for ``source``; weights sum to 1.
+
+    "white" is a flat 400–700 nm continuum with trapezoid weights over
+    ``n_samples`` points; "mono" is the single line ``lam_nm``.
+    """
+    if source == "mono":
+        lam, w = np.array([float(lam_nm)]), np.ones(1)
+    elif source == "white":
+        lam = np.linspace(400.0, 700.0, n_samples)
+        w = np.full(n_samples, lam[1] - lam[0])
+        w[[0, -1]] /= 2
+    elif source in _LINES:
+        lam, w = (np.asarray(v, dtype=float) for v in _LINES[source])
+    else:
+        raise ValueError(f"unknown source {source!r}; expected one of {SOURCES}")
+    return lam, w / w.sum()
+
+
+def intensity(x, lam, d, a, N, L):
+    """Per-wavelength pattern shaped (len(lam), len(x)); all lengths in metres, peak 1."""
+    sin_theta = x / np.sqrt(x**2 + L**2)
+    path = sin_theta / np.asarray(lam, dtype=float)[:, None]  # sinθ / λ, broadcast to (λ, x)
+    envelope = np.sinc(a * path)**2 if a > 0 else 1.0
+    gamma = np.pi * d * path
+    den = N * np.sin(gamma)
+    grating = np.divide(np.sin(N * gamma), den, out=np.ones_like(gamma), where=np.abs(den) > 1e-9)
+    return envelope * grating**2
+
+
+def pattern(x, lam, weights, d, a, N, L):
+    """Weighted sum of ``intensity`` over the spectrum, shaped (len(x),)."""
+    return np.asarray(weights) @ intensity(x, lam, d, a, N, L)
+
+
+def screen_rgb(x, y, lam, weights, d, a, h, N, L, width_px):
+    """Colour image of the screen, float32 shaped (len(y), width_px, 3), peak 1.
+
+    Each wavelength's x pattern is tinted by its colour and summed, averaged
+    into ``width_px`` pixel columns, then multiplied (outer product) by the
+    vertical single-slit envelope sinc²(h y / (λ̄ L)) of slits of height ``h``
+    at the spectrum's mean wavelength.
+    """
+    lam = np.asarray(lam, dtype=float)
+    tint = (np.asarray(weights)[:, None] * wavelength_to_rgb(lam * 1e9)).T  # (3, n_lam)
+    columns = sampling.bucket_mean(tint @ intensity(x, lam, d, a, N, L), width_px)  # (3, width_px)
+    lam_mean = float(np.dot(weights, lam))
+    rows = np.sinc(h * y / (lam_mean * L))**2
+    rgb = np.einsum("y,cx->yxc", rows.astype(np.float32), columns.astype(np.float32))
+    return rgb / (rgb.max() + 1e-12)
@@ -0,0 +1,31 @@
+"""Atomic writes for the on-disk caches (grid tables, PDF covers).
+
+Standard library only, so importing it costs the Introduction nothing.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+# World-readable like a normally created file: a cache built by a deploy step
+# running as another user must still be readable by the server.
+MODE = 0o644
+
+
+def write_atomic(path, write):
+    """Create ``path`` through ``write(tmp_path)`` on a temporary file, then rename it into place.
+
+    Readers never see a half-written file; on failure the temporary file is
+    removed and ``path`` is left as it was.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        # mkstemp creates the file 0600
+        os.chmod(tmp, MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,82 @@
+"""Vectorized hydrogen (Bohr) spectrum: levels, all transitions, series and wavelengths.
+
+Everything is computed for n = 1..n_max at once. The transition matrix is
+
+    ΔE[i, f] = 13.6 (1/n_f² − 1/n_i²) eV,
+
+positive for emission (n_i > n_f). Diagram geometry is returned as flat
+NaN-separated segment arrays, so any number of levels or transition lines
+can be drawn as a single Plotly (WebGL) trace.
+"""
+import numpy as np
+
+RYDBERG_EV = 13.6
+HC_EV_NM = 1239.841984
+SERIES = {1: "Lyman", 2: "Balmer", 3: "Paschen", 4: "Brackett", 5: "Pfund", 6: "Humphreys"}
+
+
+def series_name(n_f):
+    return SERIES.get(int(n_f), f"n_f = {int(n_f)}")
+
+
+def levels(n_max):
+    """Return ``(n, E_n)`` for n = 1..n_max."""
+    n = np.arange(1, n_max + 1)
+    return n, -RYDBERG_EV / n**2
+
+
+def transition_matrix(n_max):
+    """ΔE[n_i − 1, n_f − 1] in eV, shaped (n_max, n_max); positive entries are emission lines."""
+    inv_sq = 1.0 / np.arange(1, n_max + 1)**2
+    return RYDBERG_EV * (inv_sq[None, :] - inv_sq[:, None])
+
+
+def wavelength_nm(dE):
+    """Photon wavelength for energy ``dE`` (eV); inf where dE is 0."""
+    dE = np.abs(np.asarray(dE, dtype=float))
+    return np.divide(HC_EV_NM, dE, out=np.full_like(dE, np.inf), where=dE > 0)
+
+
+def emission_lines(n_max, n_f_max=None):
+    """All emission lines down to n_f ≤ ``n_f_max``, as flat arrays ``(n_i, n_f, dE, lam_nm)``.
+
+    Sorted by n_f, then n_i.
+    """
+    n_f_max = n_max - 1 if n_f_max is None else min(n_f_max, n_max - 1)
+    dE = transition_matrix(n_max)
+    n_i, n_f = np.nonzero(np.tril(np.ones((n_max, n_max), dtype=bool), k=-1))
+    keep = n_f < n_f_max
+    n_i, n_f = n_i[keep], n_f[keep]
+    order = np.lexsort((n_i, n_f))
+    n_i, n_f = n_i[order], n_f[order]
+    lines_dE = dE[n_i, n_f]
+    return n_i + 1, n_f + 1, lines_dE, wavelength_nm(lines_dE)
+
+
+# ---------------------------
+# Diagram geometry
+def _segments(x0, x1, y0, y1):
+    """Interleave segment endpoints with NaN breaks: x = [x0, x1, nan, ...]."""
+    count = len(x0)
+    xs = np.empty(3 * count)
+    ys = np.empty(3 * count)
+    xs[0::3], xs[1::3], xs[2::3] = x0, x1, np.nan
+    ys[0::3], ys[1::3], ys[2::3] = y0, y1, np.nan
+    return xs, ys
+
+
+def diagram(n_max, n_f_max):
+    """Segment arrays for an energy-level diagram with transitions grouped by series.
+
+    Levels span x ∈ [0, n_f_max]. Lines of the series ending on n_f sit in
+    the column [n_f − 1, n_f), spread left to right by n_i. Returns
+    ``(level_xy, line_xy, lines)`` where ``lines`` is ``emission_lines(...)``
+    and each ``*_xy`` is an ``(x, y)`` pair of NaN-separated arrays.
+    """
+    n, E = levels(n_max)
+    level_xy = _segments(np.zeros(n_max), np.full(n_max, float(n_f_max)), E, E)
+    n_i, n_f, dE, lam = lines = emission_lines(n_max, n_f_max)
+    spread = (n_i - n_f) / np.maximum(n_max - n_f, 1)
+    x = n_f - 1 + 0.1 + 0.8 * spread
+    line_xy = _segments(x, x, E[n_i - 1], E[n_f - 1])
+    return level_xy, line_xy, lines
@@ -0,0 +1,184 @@
+"""Pure, cached physics kernels keyed on slider values.
+
+Every function here takes plain numbers (the values the sidebar sliders hand
+back) and returns NumPy arrays / floats. Results are memoized process-wide
+with a bounded ``st.cache_data`` so students sitting on the same slider
+positions are served from memory instead of recomputing the arrays.
+"""
+import numpy as np
+import streamlit as st
+
+from physics import diffraction, hydrogen, photoemission, photons, sampling, schrodinger, spacetime, spectral, store
+from physics.store import Axis
+
+# Constants
+h_eVs = 4.135667696e-15
+c = 299792458
+a0_angstrom = 0.529
+rydberg_eV = hydrogen.RYDBERG_EV
+
+# One bounded cache policy for every kernel: slider grids are small, so a few
+# hundred entries per kernel covers a whole classroom; the TTL keeps a
+# long-running server from pinning stale entries forever.
+CACHE = dict(max_entries=512, ttl=6 * 3600, show_spinner=False)
+
+# Kernels that depend only on discrete slider values are also tabulated over
+# the full slider grid by ``python -m physics.store``; built tables are served
+# from a shared memory map and ``st.cache_data`` only sees off-grid calls.
+TABLE = dict(cache=st.cache_data(**CACHE))
+
+
+# ---------------------------
+# 1. Special Relativity
+@store.table("lorentz_gamma", [Axis(0.0, 0.01, 100)], depends=[spacetime], **TABLE)
+def lorentz_gamma(v_frac):
+    return spacetime.gamma(v_frac)
+
+
+def relativity(v_frac, L0):
+    """Return ``(gamma, L)``: the Lorentz factor and the contracted length."""
+    gamma = float(lorentz_gamma(v_frac))
+    return gamma, L0 / gamma
+
+
+@st.cache_data(**CACHE)
+def spacetime_scene(preset, v_frac, L0, frame="rest", n_events=2000):
+    """Every layer of the spacetime diagram; see ``spacetime.scene``."""
+    return spacetime.scene(preset, v_frac, L0, frame, n_events)
+
+
+# ---------------------------
+# 2. Photoelectric Effect
+@store.table("kmax_curve", [Axis(1.0, 0.1, 41)], **TABLE)
+def kmax_curve(phi, f_max_1e14=100.0, n_f=500):
+    """K_max (eV) on ``np.linspace(0, f_max_1e14, n_f)`` for work function ``phi``."""
+    return np.maximum(h_eVs * np.linspace(0, f_max_1e14, n_f) * 1e14 - phi, 0)
+
+
+def photoelectric(freq_1e14, phi, f_max_1e14=100.0, n_f=500):
+    """Return ``(E, Kmax, f_axis_1e14, K_curve)``; frequencies in units of 10¹⁴ Hz."""
+    E = h_eVs * freq_1e14 * 1e14
+    Kmax = max(E - phi, 0)
+    f_axis = np.linspace(0, f_max_1e14, n_f)
+    return E, Kmax, f_axis, kmax_curve(phi, f_max_1e14, n_f)
+
+
+@st.cache_data(**CACHE)
+def photocurrent(freq_1e14, phi, power_nW, exposure_s=1e-3, V_max=2.0, n_V=400, seed=0):
+    """Return ``(V, I_pA, n_photons, n_emitted, V_stop)`` from one seeded Monte Carlo exposure.
+
+    ``V`` runs from 0.5 V past the ideal stopping potential K_max / e (as a
+    negative, retarding voltage) up to ``V_max``; ``V_stop`` is the largest
+    normal energy actually drawn, i.e. where the simulated current reaches 0.
+    """
+    E = h_eVs * freq_1e14 * 1e14
+    rng = np.random.default_rng(seed)
+    n_photons, K_normal = photoemission.emit(rng, E, phi, power_nW * 1e-9, exposure_s)
+    V = np.linspace(-max(E - phi, 0) - 0.5, V_max, n_V)
+    I = photoemission.iv_curve(K_normal, V, exposure_s) * 1e12
+    V_stop = float(K_normal.max()) if len(K_normal) else 0.0
+    return V, I, n_photons, len(K_normal), V_stop
+
+
+# ---------------------------
+# 3. Double-Slit
+def grating_grid(lam_nm, d, L, N, half_width_m=0.05, points_per_fringe=16, max_elements=4_000_000):
+    """Screen grid (m) that resolves the shortest wavelength's fringes and the N − 2
+    secondary maxima between them, within a (wavelength × x) ``max_elements`` budget."""
+    period = np.min(lam_nm) * 1e-9 * L / d
+    return sampling.periodic_grid(-half_width_m, half_width_m, period, max(points_per_fringe, 4 * N),
+                                  max_points=max(1000, max_elements // np.size(lam_nm)))
+
+
+@st.cache_data(**CACHE)
+def grating(d_mm, lam_nm, L, a_um=0.0, N=2, source="mono", half_width_m=0.05, n_buckets=1500):
+    """Return ``(x_mm, I)`` for N slits of width ``a_um`` lit by ``source``, peak-normalized.
+
+    One (wavelength × x) broadcast on ``grating_grid``, then min/max-downsampled.
+    """
+    lam, weights = diffraction.spectrum(source, lam_nm)
+    d, a = d_mm * 1e-3, a_um * 1e-6
+    x = grating_grid(lam, d, L, N, half_width_m)
+    I = diffraction.pattern(x, lam * 1e-9, weights, d, a, N, L)
+    x, I = sampling.minmax_downsample(x, I / (I.max() + 1e-12), n_buckets)
+    return x * 1000, I
+
+
+@st.cache_data(**CACHE)
+def photon_cdf(d_mm, lam_nm, L, a_um=0.0, N=2, source="mono", half_width_m=0.05, n_cells=20_000):
+    """Detection CDF over ``n_cells`` equal cells spanning ±``half_width_m``; see ``photons.cell_cdf``.
+
+    Built from the full-resolution ``grating`` pattern, before downsampling.
+    """
+    lam, weights = diffraction.spectrum(source, lam_nm)
+    d, a = d_mm * 1e-3, a_um * 1e-6
+    x = grating_grid(lam, d, L, N, half_width_m)
+    return photons.cell_cdf(diffraction.pattern(x, lam * 1e-9, weights, d, a, N, L), n_cells)
+
+
+# ---------------------------
+# 4. Bohr Model
+@store.table("bohr", [Axis(1, 1, 300), Axis(1, 1, 300)], depends=[hydrogen], **TABLE)
+def bohr_row(n1, n2):
+    r1 = n1**2 * a0_angstrom
+    E1, E2 = -rydberg_eV / n1**2, -rydberg_eV / n2**2
+    dE = abs(E1 - E2)
+    return np.array([r1, dE, hydrogen.wavelength_nm(dE), E1, E2])
+
+
+def bohr(n1, n2):
+    """Return ``(r1, dE, lam_nm, E1, E2)``: orbit radius (Å), |ΔE| (eV), photon wavelength and both level energies."""
+    return tuple(float(v) for v in bohr_row(n1, n2))
+
+
+@st.cache_data(**CACHE)
+def hydrogen_diagram(n_max, n_f_max):
+    """Level and transition segments for n ≤ ``n_max`` and series n_f ≤ ``n_f_max`` (see ``hydrogen.diagram``)."""
+    return hydrogen.diagram(n_max, n_f_max)
+
+
+# ---------------------------
+# 5. Particle in a Box
+def _normalize_peak(prob):
+    return prob / (prob.max(axis=-1, keepdims=True) + 1e-12)
+
+
+@store.table("box_evolution", [Axis(1, 1, 5), Axis(1, 1, 5), Axis(0.0, 0.05, 21)], depends=[spectral], **TABLE)
+def box_probability(n1, n2, amp, n_frames=100, t_max=4.0, L=1.0, n_x=500):
+    """|ψ|² of ψ₁ + amp·ψ₂ shaped (n_frames, n_x) over ``t_max``, each row peak-normalized."""
+    _, prob = spectral.evolve(spectral.two_state(n1, n2, amp), np.linspace(0, t_max, n_frames), n_x, L)
+    return _normalize_peak(prob)
+
+
+def box_evolution(n1, n2, amp, n_frames=100, t_max=4.0, L=1.0, n_x=500):
+    """Return ``(t, x, prob)`` with ``prob`` shaped (n_frames, n_x), each row peak-normalized."""
+    return (np.linspace(0, t_max, n_frames), np.linspace(0, L, n_x),
+            box_probability(n1, n2, amp, n_frames, t_max, L, n_x))
+
+
+@st.cache_data(**CACHE)
+def packet_evolution(x0, sigma, n0, n_states, n_frames=120, periods=2.0, L=1.0, n_x=500):
+    """Return ``(t, x, prob)`` for a Gaussian packet over ``periods`` classical round trips."""
+    t = np.linspace(0, periods * spectral.classical_period(n0), n_frames)
+    coeffs = spectral.gaussian_packet(x0, sigma, n0, n_states, n_x, L)
+    x, prob = spectral.evolve(coeffs, t, n_x, L)
+    return t, x, _normalize_peak(prob)
+
+
+@st.cache_data(**CACHE)
+def potential_evolution(kind, V0, x0, sigma, n0, width=0.2, samples=None, n_frames=100, periods=2.0,
+                        steps_per_frame=20, L=1.0, n_x=513):
+    """Return ``(t, x, prob, V)`` for a Gaussian packet in the potential ``kind``; see ``schrodinger``.
+
+    Same packet and time span as ``packet_evolution``; ``samples`` (a tuple)
+    shapes the "custom" potential.
+    """
+    x = np.linspace(0, L, n_x)
+    V = schrodinger.potential(kind, x, V0, width, samples, L)
+    dt = periods * spectral.classical_period(n0) / ((n_frames - 1) * steps_per_frame)
+    psi0 = spectral.gaussian_wavefunction(x, x0, sigma, n0, L)
+    t, prob = [], []
+    for ti, psi in schrodinger.evolve(psi0, V, dt, n_frames, steps_per_frame, L):
+        t.append(ti)
+        prob.append(psi.real**2 + psi.imag**2)
+    return np.array(t), x, _normalize_peak(np.array(prob)), V
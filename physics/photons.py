@@ -0,0 +1,71 @@
+"""Photon-by-photon detection on the interference screen.
+
+The intensity pattern is a probability density for where each photon lands.
+It is integrated once into ``n_cells`` equal screen cells, giving a
+cumulative distribution over the cell edges; a batch of hits is then
+
+    u ~ U(0, 1),   cell = searchsorted(cdf, u),   x = edge + (u − cdf[cell]) / p[cell] · width,
+
+i.e. inverse-CDF sampling with linear interpolation inside a cell. Hits are
+binned with ``bincount`` into a running histogram, so adding a batch costs
+O(batch) no matter how many photons are already on the screen.
+"""
+import numpy as np
+
+from physics import sampling
+
+BATCHES = (10, 100, 10_000, 1_000_000)
+
+
+def cell_cdf(I, n_cells=20_000):
+    """Cumulative distribution over ``n_cells + 1`` equal-cell edges of a pattern sampled on a uniform grid.
+
+    Each cell's weight is the mean of ``I`` over it (what the cell integrates),
+    so fringes finer than a cell are still counted with the right total.
+    """
+    p = sampling.bucket_mean(np.asarray(I, dtype=float), n_cells)
+    cdf = np.concatenate([[0.0], np.cumsum(p)])
+    return cdf / cdf[-1]
+
+
+def sample(rng, cdf, x0, x1, n):
+    """Draw ``n`` hit positions in [x0, x1], in increasing order, from ``cdf`` with the Generator ``rng``."""
+    # Sorted keys let searchsorted walk the CDF once instead of missing cache on every lookup
+    # (~4× faster at 10⁶ hits); the hits come out in x order, which binning doesn't care about.
+    u = np.sort(rng.random(n))
+    cell = np.clip(np.searchsorted(cdf, u, side="right") - 1, 0, len(cdf) - 2)
+    lo, p = cdf[cell], np.diff(cdf)[cell]
+    frac = np.divide(u - lo, p, out=np.full_like(u, 0.5), where=p > 0)
+    return x0 + (cell + frac) * ((x1 - x0) / (len(cdf) - 1))
+
+
+def histogram(x, x0, x1, n_bins):
+    """Counts of ``x`` in ``n_bins`` equal bins over [x0, x1], as int64."""
+    idx = ((np.asarray(x) - x0) * (n_bins / (x1 - x0))).astype(np.int64)
+    return np.bincount(np.clip(idx, 0, n_bins - 1), minlength=n_bins)
+
+
+def bin_probabilities(cdf, n_bins):
+    """Probability of each of ``n_bins`` equal bins, read off the cell CDF."""
+    return np.diff(np.interp(np.linspace(0, 1, n_bins + 1), np.linspace(0, 1, len(cdf)), cdf))
+
+
+def new_screen(key, n_bins=500, seed=None):
+    """A fresh accumulator: the parameter ``key`` it belongs to, a histogram, the last hits and a Generator."""
+    return dict(key=key, counts=np.zeros(n_bins, dtype=np.int64), total=0, last=np.empty((0, 2)),
+                rng=np.random.default_rng(seed))
+
+
+def detect(screen, cdf, x0, x1, n, keep_last=2000):
+    """Fire ``n`` photons at ``screen`` in place: sample, bin and remember up to ``keep_last`` hits.
+
+    ``screen["last"]`` holds ``(x, y)`` rows with y uniform in [0, 1), for
+    drawing individual detections.
+    """
+    rng = screen["rng"]
+    hits = sample(rng, cdf, x0, x1, n)
+    screen["counts"] += histogram(hits, x0, x1, len(screen["counts"]))
+    screen["total"] += n
+    shown = rng.choice(hits, size=min(n, keep_last), replace=False)
+    screen["last"] = np.column_stack([shown, rng.random(len(shown))])
+    return screen
@@ -0,0 +1,74 @@
+"""Split-operator time evolution for arbitrary potentials inside the box.
+
+In the app's units (Eₙ = n² for the bare well, so T = (kL/π)²) one step of
+length dt is the Strang splitting
+
+    ψ ← e^{−iV dt/2} · F⁻¹ e^{−iT(k) dt} F · e^{−iV dt/2} ψ,
+
+which is unitary for any V and costs two FFTs, O(N log N). The walls stay
+hard: ψ on the interior points is extended oddly about x = 0 and x = L
+before the FFT, so the transform is a sine transform whose modes are
+exactly the well's eigenstates. With V = 0 each mode therefore picks up
+exactly the phase e^{−in²t}, matching ``spectral.evolve``.
+
+Frames come from a generator, so callers pull only as many as they draw.
+"""
+import numpy as np
+
+POTENTIALS = ("none", "finite_well", "barrier", "harmonic", "custom")
+
+
+def potential(kind, x, V0, width=0.2, samples=None, L=1.0):
+    """V(x) for a preset: a well or barrier of ``width`` centred in the box, a harmonic
+    trap reaching ``V0`` at the walls, or ``V0`` times ``samples`` interpolated across the box."""
+    x = np.asarray(x, dtype=float)
+    inside = np.abs(x - L / 2) <= width / 2
+    if kind == "none":
+        return np.zeros_like(x)
+    if kind == "finite_well":
+        return np.where(inside, 0.0, float(V0))
+    if kind == "barrier":
+        return np.where(inside, float(V0), 0.0)
+    if kind == "harmonic":
+        return V0 * (2 * x / L - 1)**2
+    if kind == "custom":
+        samples = np.asarray(samples, dtype=float)
+        return V0 * np.interp(x, np.linspace(0, L, len(samples)), samples)
+    raise ValueError(f"unknown potential {kind!r}; expected one of {POTENTIALS}")
+
+
+def kinetic_phase(n_x, dt, L=1.0):
+    """e^{−iT(k) dt} on the FFT grid of the odd extension (length 2(n_x − 1))."""
+    k = 2 * np.pi * np.fft.fftfreq(2 * (n_x - 1), d=L / (n_x - 1))
+    return np.exp(-1j * (k * L / np.pi)**2 * dt)
+
+
+def evolve(psi0, V, dt, n_frames, steps_per_frame=1, L=1.0):
+    """Yield ``(t, psi)`` for ``n_frames`` frames, ``steps_per_frame`` steps of ``dt`` apart.
+
+    ``psi0`` and ``V`` are sampled on ``np.linspace(0, L, n_x)``; the end
+    points are the walls, where ψ stays 0. Consecutive half-steps of V
+    inside a frame are merged into one full step. FFTs are fastest when
+    2(n_x − 1) is a power of two (n_x = 513 runs ~4× faster than 500).
+    """
+    n_x = len(psi0)
+    kinetic = kinetic_phase(n_x, dt, L)
+    half_v = np.exp(-0.5j * np.asarray(V, dtype=float)[1:-1] * dt)
+    full_v = half_v**2
+    ext = np.zeros(2 * (n_x - 1), dtype=complex)
+    psi = np.zeros(n_x, dtype=complex)
+    psi[1:-1] = psi0[1:-1]
+    interior = psi[1:-1]
+    yield 0.0, psi.copy()
+    for frame in range(1, n_frames):
+        interior *= half_v
+        for step in range(steps_per_frame):
+            ext[1:n_x - 1] = interior
+            ext[n_x:] = -interior[::-1]
+            interior[:] = np.fft.ifft(kinetic * np.fft.fft(ext))[1:n_x - 1]
+            interior *= full_v if step < steps_per_frame - 1 else half_v
+        yield frame * steps_per_frame * dt, psi.copy()
+
+
+def norm(psi, x):
+    return np.trapezoid(np.abs(psi)**2, x)
@@ -0,0 +1,172 @@
+"""Batched Lorentz boosts for spacetime (Minkowski) diagrams.
+
+Units have c = 1: an event is a row ``(x, ct)`` in one length unit. The boost
+to a frame moving at β along +x is
+
+    Λ(β) = γ [[1, −β], [−β, 1]]    acting on (x, ct),
+
+and a scene (worldlines, grids, light cone, simultaneity lines, an event
+cloud) is transformed as a single ``(N, 2) @ Λ`` product over all of its
+points. Polylines are NaN-separated, so each layer is one Plotly trace no
+matter how many lines it holds.
+
+Scenes are built in the rest frame S (the barn, the stay-at-home twin) and
+boosted into S' (the ladder, the outbound twin) when that frame is viewed.
+"""
+import numpy as np
+
+PRESETS = ("rod", "ladder", "twin")
+FRAMES = ("rest", "moving")
+BARN_RATIO = 0.8  # barn length as a fraction of the ladder's proper length
+
+
+def gamma(beta):
+    return 1 / np.sqrt(1 - beta**2)
+
+
+def boost_matrix(beta):
+    """Λ(β) for row vectors ``(x, ct)``; symmetric, so ``points @ Λ`` is the boost."""
+    g = gamma(beta)
+    return g * np.array([[1.0, -beta], [-beta, 1.0]])
+
+
+def boost(points, beta):
+    """Coordinates of ``points`` (shape (..., 2)) in the frame moving at ``beta``; NaN rows stay NaN."""
+    return np.asarray(points, dtype=float) @ boost_matrix(beta)
+
+
+def polylines(lines):
+    """Join (n_i, 2) vertex arrays into one array with a NaN row after each line."""
+    if not lines:
+        return np.empty((0, 2))
+    gap = np.full((1, 2), np.nan)
+    return np.concatenate([part for line in lines for part in (np.asarray(line, dtype=float), gap)])
+
+
+def grid(span, step, beta=0.0):
+    """Lines of constant x′ and constant ct′ of the frame moving at ``beta``, in rest-frame coordinates.
+
+    The lattice covers |x′|, |ct′| ≤ ``span`` with spacing ``step``.
+    """
+    k = np.arange(-np.floor(span / step), np.floor(span / step) + 1) * step
+    count = len(k)
+    ends = np.array([-span, span, np.nan])
+    const_x = np.column_stack([np.repeat(k, 3), np.tile(ends, count)])
+    const_t = const_x[:, ::-1]
+    return boost(np.concatenate([const_x, const_t]), -beta)
+
+
+def light_cone(span):
+    """The two null lines x = ±ct through the origin."""
+    return polylines([[(-span, -span), (span, span)], [(-span, span), (span, -span)]])
+
+
+def simultaneity(event, beta, span):
+    """Line of simultaneity through ``event`` for the frame moving at ``beta`` (slope ct/x = β)."""
+    direction = np.array([1.0, beta]) * span
+    return np.array([event - direction, event + direction])
+
+
+def proper_time_ticks(vertices, step):
+    """Points every ``step`` of proper time along a timelike polyline."""
+    vertices = np.asarray(vertices, dtype=float)
+    d = np.diff(vertices, axis=0)
+    tau = np.concatenate([[0.0], np.cumsum(np.sqrt(np.maximum(d[:, 1]**2 - d[:, 0]**2, 0)))])
+    marks = np.arange(0.0, tau[-1] + 1e-12, step)
+    return np.column_stack([np.interp(marks, tau, vertices[:, 0]), np.interp(marks, tau, vertices[:, 1])])
+
+
+def interval_class(points):
+    """Relation of each event to the origin: 1 timelike, 0 lightlike, −1 spacelike.
+
+    s² = (ct)² − x² is invariant, so the classes don't change under a boost.
+    """
+    s2 = points[:, 1]**2 - points[:, 0]**2
+    return np.sign(np.where(np.isclose(s2, 0.0, atol=1e-9), 0.0, s2)).astype(np.int8)
+
+
+def event_cloud(n, center, half_width, seed=0):
+    """``n`` reproducible random events uniform over the square ``center ± half_width``."""
+    rng = np.random.default_rng(seed)
+    return center + rng.uniform(-half_width, half_width, size=(n, 2))
+
+
+def _nice_step(length):
+    """Round ``length`` down to 1, 2 or 5 × 10ᵏ."""
+    power = 10.0**np.floor(np.log10(length))
+    return power * max(m for m in (1, 2, 5) if m * power <= length)
+
+
+def _key_events(preset, beta, L0):
+    """Key events, simultaneity lines ``(event, β)`` and view center of a preset, in S."""
+    if preset == "rod":
+        # The moving rod's ends at ct = 0: simultaneous in S, so their separation is L0 / γ.
+        events = np.array([[0.0, 0.0], [L0 / gamma(beta), 0.0]])
+        return events, [(events[0], 0.0), (events[0], beta)], np.array([L0 / 2, 0.6 * L0])
+    if preset == "ladder":
+        # Both barn doors close at ct = 0 (barn frame) as the ladder's back end enters.
+        events = np.array([[0.0, 0.0], [BARN_RATIO * L0, 0.0]])
+        return events, [(events[0], 0.0), (events[0], beta)], np.array([BARN_RATIO * L0 / 2, 0.6 * L0])
+    if preset == "twin":
+        # Departure, turnaround at ct = L0 and reunion at ct = 2 L0 (home frame).
+        events = np.array([[0.0, 0.0], [beta * L0, L0], [0.0, 2 * L0]])
+        return events, [(events[1], beta), (events[1], -beta)], np.array([0.0, L0])
+    raise ValueError(f"unknown preset {preset!r}; expected one of {PRESETS}")
+
+
+def _worldlines(preset, beta, L0, events, t_end):
+    """``(rest, moving)`` lists of worldline vertex arrays, in S."""
+    if preset == "twin":
+        return [events[[0, 2]]], [events]
+    # A rod (or ladder) of proper length L0 moving at β, back end through the origin,
+    # next to a rod at rest on [0, L0] (or the barn's doors).
+    t = np.array([0.0, t_end])
+    far = L0 if preset == "rod" else BARN_RATIO * L0
+    rest = [np.column_stack([np.full(2, x), t]) for x in (0.0, far)]
+    moving = [np.column_stack([x + beta * t, t]) for x in (0.0, L0 / gamma(beta))]
+    return rest, moving
+
+
+def scene(preset, beta, L0, frame="rest", n_events=2000, seed=0):
+    """Every layer of a spacetime diagram, as seen from ``frame``.
+
+    Returns a dict of ``(x, ct)`` array pairs: ``grid_rest``, ``grid_moving``,
+    ``cone``, ``rest``, ``moving`` (worldlines), ``simultaneity``, ``ticks``
+    (one per ``step`` of proper time), ``events`` and ``cloud``, plus
+    ``cloud_class`` (see ``interval_class``), ``step`` and the view
+    ``x_range`` / ``ct_range``. All layers share one boost.
+    """
+    if frame not in FRAMES:
+        raise ValueError(f"unknown frame {frame!r}; expected one of {FRAMES}")
+    view_beta = beta if frame == "moving" else 0.0
+    events, sims, center = _key_events(preset, beta, L0)
+    # The view is square around the boosted center, wide enough for every key event.
+    seen = boost(np.vstack([events, center]), view_beta)
+    view_half = max(1.2 * L0, 0.6 * np.ptp(seen, axis=0).max())
+    step = _nice_step(view_half / 4)
+    # A boost stretches lengths by up to γ(1 + β), so S-frame layers this large fill the view.
+    span = (np.abs(seen[-1]).max() + view_half) * gamma(beta) * (1 + beta)
+    rest, moving = _worldlines(preset, beta, L0, events, span)
+    cloud = event_cloud(n_events, center, 1.2 * L0, seed)
+
+    layers = dict(
+        grid_rest=grid(span, step),
+        grid_moving=grid(span, step, beta),
+        cone=light_cone(span),
+        rest=polylines(rest),
+        moving=polylines(moving),
+        simultaneity=polylines([simultaneity(event, b, span) for event, b in sims]),
+        ticks=np.concatenate([proper_time_ticks(line, step) for line in rest + moving]),
+        events=events,
+        cloud=cloud,
+    )
+    names = list(layers)
+    flat = boost(np.concatenate([layers[name] for name in names]), view_beta)
+    parts = np.split(flat, np.cumsum([len(layers[name]) for name in names])[:-1])
+    out = {name: (part[:, 0], part[:, 1]) for name, part in zip(names, parts)}
+    cx, ct = seen[-1]
+    out.update(
+        cloud_class=interval_class(cloud), step=step,
+        x_range=(cx - view_half, cx + view_half), ct_range=(ct - view_half, ct + view_half),
+    )
+    return out
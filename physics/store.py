@@ -0,0 +1,239 @@
+"""Precomputed slider-grid tables, served from memory-mapped ``.npy`` files.
+
+Most sliders are discrete (v/c in 0.01 steps, φ in 0.1 eV steps, Bohr n and
+well states as integers), so a kernel whose inputs are all slider values
+can be evaluated once over the whole grid. ``@table`` registers such a
+kernel with one ``Axis`` per grid argument:
+
+* ``python -m physics.store`` builds every table into ``STORE_DIR``
+  (``MODERN_PHYSICS_GRID_DIR``, default ``.cache/grid``) as a float32
+  ``<name>.npy`` of shape ``(*axis counts, *result shape)`` plus a
+  ``<name>.json`` manifest. A table is rebuilt only when its fingerprint
+  differs from the manifest. The fingerprint covers the kernel's source,
+  every module-level name it reads (constants by value, helper functions
+  by source, followed through the helpers' own globals, this repository's
+  modules by file contents), the modules it lists in ``depends``, its axes
+  and its default arguments. Editing one kernel, or one chapter's physics
+  module, therefore recomputes only the tables that use it.
+* At run time a call with on-grid values and default keyword arguments
+  returns a read-only row of the memory-mapped file. The pages live in the
+  OS page cache, so every server process on the machine shares one copy. A
+  table built or rebuilt while the server runs is picked up on the next call.
+  Anything else (a missing or stale table, an off-grid value, a non-default
+  argument) falls through to the kernel itself, behind ``cache``.
+"""
+import argparse
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from physics import files
+
+ROOT = Path(__file__).resolve().parent.parent
+STORE_DIR = Path(os.environ.get("MODERN_PHYSICS_GRID_DIR") or ROOT / ".cache" / "grid")
+DTYPE = np.float32
+
+TABLES = {}
+
+
+class Axis(NamedTuple):
+    """``count`` evenly spaced slider values from ``start`` in steps of ``step``."""
+    start: float
+    step: float
+    count: int
+
+    def values(self):
+        return [self.start + i * self.step for i in range(self.count)]
+
+    def index(self, value):
+        """Position of ``value`` on the axis, or None when it is off the grid."""
+        i = round((value - self.start) / self.step)
+        if 0 <= i < self.count and abs(self.start + i * self.step - value) <= 1e-6 * abs(self.step):
+            return i
+        return None
+
+
+class Table(NamedTuple):
+    name: str
+    fn: object
+    axes: tuple
+    defaults: dict
+    depends: tuple
+
+
+def _code_names(code):
+    """Global and attribute names used by ``code`` and the functions and comprehensions nested in it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _reads(fn, found=None):
+    """Module-level names ``fn`` reads, followed into the functions of the same module it calls."""
+    found = {} if found is None else found
+    fn = inspect.unwrap(fn)
+    for name in sorted(_code_names(fn.__code__) & fn.__globals__.keys()):
+        if name in found:
+            continue
+        value = found[name] = fn.__globals__[name]
+        if inspect.isfunction(value) and inspect.unwrap(value).__module__ == fn.__module__:
+            _reads(value, found)
+    return found
+
+
+def _digest(value):
+    """What a read global contributes to a fingerprint: source, file contents or value."""
+    if inspect.ismodule(value):
+        path = getattr(value, "__file__", None)
+        # Third-party and standard-library modules are covered by the kernel's own source.
+        return Path(path).read_bytes() if path and Path(path).resolve().is_relative_to(ROOT) else b""
+    if inspect.isfunction(value):
+        return inspect.getsource(inspect.unwrap(value)).encode()
+    return repr(value).encode()
+
+
+def fingerprint(spec):
+    h = hashlib.sha256(inspect.getsource(spec.fn).encode())
+    for name, value in sorted(_reads(spec.fn).items()):
+        h.update(name.encode() + b"=" + _digest(value))
+    for module in spec.depends:
+        h.update(Path(module.__file__).read_bytes())
+    h.update(repr((spec.axes, sorted(spec.defaults.items()))).encode())
+    return h.hexdigest()[:24]
+
+
+def _paths(name, directory=None):
+    directory = Path(directory or STORE_DIR)
+    return directory / f"{name}.npy", directory / f"{name}.json"
+
+
+@functools.lru_cache(maxsize=64)
+def _map(name, manifest_mtime_ns, data_mtime_ns):
+    """The table's memory map, or None if its kernel changed since it was built."""
+    data, manifest = _paths(name)
+    try:
+        meta = json.loads(manifest.read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("fingerprint") != fingerprint(TABLES[name]):
+        return None
+    try:
+        return np.load(data, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+
+def _open(name):
+    """The table's memory map, or None if it hasn't been built or is stale.
+
+    Keyed on the files' mtimes, so a missing table is not remembered as
+    missing and a rebuilt one replaces the old map.
+    """
+    data, manifest = _paths(name)
+    try:
+        return _map(name, manifest.stat().st_mtime_ns, data.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def lookup(name, values):
+    """The stored row for grid ``values``, or None."""
+    rows = _open(name)
+    if rows is None:
+        return None
+    index = tuple(axis.index(v) for axis, v in zip(TABLES[name].axes, values))
+    return None if None in index else rows[index]
+
+
+def table(name, axes, depends=(), cache=None):
+    """Register ``fn`` as the grid table ``name``; its first ``len(axes)`` arguments are the grid.
+
+    The returned function serves stored rows when it can; otherwise it calls
+    ``fn`` wrapped by ``cache`` (for example a ``st.cache_data`` decorator).
+    """
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        params = list(signature.parameters.values())
+        grid = [p.name for p in params[:len(axes)]]
+        defaults = {p.name: p.default for p in params[len(axes):]}
+        TABLES[name] = Table(name, fn, tuple(axes), defaults, tuple(depends))
+        compute = cache(fn) if cache else fn
+
+        @functools.wraps(fn)
+        def serve(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            if all(bound.arguments.get(k, v) == v for k, v in defaults.items()):
+                row = lookup(name, [bound.arguments[k] for k in grid])
+                if row is not None:
+                    return row
+            return compute(*args, **kwargs)
+        return serve
+    return decorate
+
+
+def build_table(spec, directory=None):
+    """Evaluate ``spec.fn`` at every grid point and write the table; returns its shape."""
+    grid = list(itertools.product(*(axis.values() for axis in spec.axes)))
+    first = np.asarray(spec.fn(*grid[0]), dtype=DTYPE)
+    shape = tuple(axis.count for axis in spec.axes) + first.shape
+
+    def fill(path):
+        rows = np.lib.format.open_memmap(path, mode="w+", dtype=DTYPE, shape=shape)
+        flat = rows.reshape(len(grid), *first.shape)
+        flat[0] = first
+        for i, point in enumerate(grid[1:], 1):
+            flat[i] = spec.fn(*point)
+        rows.flush()
+
+    data_path, manifest_path = _paths(spec.name, directory)
+    files.write_atomic(data_path, fill)
+    meta = dict(name=spec.name, fingerprint=fingerprint(spec), shape=list(shape), dtype=np.dtype(DTYPE).name,
+                axes=[axis._asdict() for axis in spec.axes], defaults={k: repr(v) for k, v in spec.defaults.items()})
+    files.write_atomic(manifest_path, lambda path: Path(path).write_text(json.dumps(meta, indent=2)))
+    return shape
+
+
+def stale(spec, directory=None):
+    data, manifest = _paths(spec.name, directory)
+    try:
+        return not data.exists() or json.loads(manifest.read_text())["fingerprint"] != fingerprint(spec)
+    except (OSError, ValueError, KeyError):
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed slider-grid tables.")
+    parser.add_argument("names", nargs="*", help="tables to consider (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the fingerprint matches")
+    parser.add_argument("--dir", default=str(STORE_DIR), help="output directory")
+    args = parser.parse_args()
+
+    # Outside ``streamlit run`` every st.cache_data decorator warns that there is no runtime.
+    from streamlit.logger import get_logger
+    get_logger("streamlit.runtime.caching.cache_data_api").setLevel("ERROR")
+    # Run as ``python -m``, this file is ``__main__``; the tables register on the imported module.
+    from physics import kernels, store  # noqa: F401
+
+    for name in args.names or store.TABLES:
+        spec = store.TABLES[name]
+        if not args.force and not store.stale(spec, args.dir):
+            print(f"{name:<16} up to date")
+            continue
+        start = time.perf_counter()
+        shape = store.build_table(spec, args.dir)
+        size = np.prod(shape) * np.dtype(DTYPE).itemsize
+        print(f"{name:<16} built {shape} in {time.perf_counter() - start:.1f} s ({size / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
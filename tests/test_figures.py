@@ -0,0 +1,15 @@
+import numpy as np
+
+from ui import figures
+
+
+def test_photon_build_up_keeps_the_two_row_layout():
+    fig = figures.photon_build_up(-50, 50, np.zeros(20), np.zeros(20), np.zeros((5, 2)))
+    layout = fig.layout
+    assert layout.yaxis.domain == (0.7875, 1.0)
+    assert layout.yaxis2.domain[1] < layout.yaxis.domain[0]
+    assert (layout.xaxis.anchor, layout.yaxis.anchor) == ("y", "x")
+    assert (layout.xaxis2.anchor, layout.yaxis2.anchor) == ("y2", "x2")
+    assert layout.yaxis.range == (0, 1)
+    assert layout.xaxis.range == layout.xaxis2.range == (-50, 50)
+    assert layout.xaxis2.title.text == "x (mm)"
@@ -0,0 +1,91 @@
+import importlib
+import sys
+import textwrap
+
+from physics import store
+
+KERNELS = '''
+import numpy as np
+
+from physics.store import Axis, table
+
+SCALE = 2.0
+
+
+def _square(x):
+    return x * x
+
+
+@table("{prefix}double", [Axis(0, 1, 4)])
+def double(a):
+    return SCALE * a
+
+
+@table("{prefix}square", [Axis(0, 1, 4)])
+def square(a):
+    return _square(np.float64(a))
+
+
+def untabulated(a):
+    """Not a table."""
+    return a
+'''
+
+
+def fingerprints(tables, prefix):
+    return {name[len(prefix):]: store.fingerprint(spec) for name, spec in tables.items() if name.startswith(prefix)}
+
+
+def load(tmp_path, monkeypatch, source, prefix="fp_"):
+    """Import ``source`` as a fresh module; each version gets its own file, so no cached bytecode or lines apply."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    name = f"{tmp_path.name}_{len(list(tmp_path.glob('*.py')))}"
+    (tmp_path / f"{name}.py").write_text(textwrap.dedent(source).replace("{prefix}", prefix))
+    importlib.invalidate_caches()
+    return importlib.import_module(name)
+
+
+def test_editing_one_kernel_keeps_the_other_fingerprints(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "TABLES", {})
+    load(tmp_path, monkeypatch, KERNELS)
+    before = fingerprints(store.TABLES, "fp_")
+
+    load(tmp_path, monkeypatch, KERNELS.replace("return SCALE * a", "return SCALE * a + 0"))
+    after = fingerprints(store.TABLES, "fp_")
+    assert after["double"] != before["double"]
+    assert after["square"] == before["square"]
+
+
+def test_constants_and_helpers_are_covered(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "TABLES", {})
+    load(tmp_path, monkeypatch, KERNELS)
+    before = fingerprints(store.TABLES, "fp_")
+
+    load(tmp_path, monkeypatch, KERNELS.replace("SCALE = 2.0", "SCALE = 3.0"))
+    after = fingerprints(store.TABLES, "fp_")
+    assert after["double"] != before["double"]
+    assert after["square"] == before["square"]
+
+    load(tmp_path, monkeypatch, KERNELS.replace("return x * x", "return x ** 2"))
+    after = fingerprints(store.TABLES, "fp_")
+    assert after["square"] != before["square"]
+    assert after["double"] == before["double"]
+
+
+def test_unrelated_edits_leave_every_fingerprint(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "TABLES", {})
+    load(tmp_path, monkeypatch, KERNELS)
+    before = fingerprints(store.TABLES, "fp_")
+
+    load(tmp_path, monkeypatch, KERNELS.replace('"""Not a table."""', '"""Still not a table."""'))
+    assert fingerprints(store.TABLES, "fp_") == before
+
+
+def test_app_tables_only_follow_their_own_constants(monkeypatch):
+    from physics import kernels
+
+    before = {name: store.fingerprint(spec) for name, spec in store.TABLES.items()}
+    monkeypatch.setattr(kernels, "h_eVs", kernels.h_eVs * 1.01)
+    after = {name: store.fingerprint(spec) for name, spec in store.TABLES.items()}
+    assert {name for name in before if after[name] != before[name]} == {"kmax_curve"}
@@ -0,0 +1 @@
+"""Figure, page and language helpers for the bilingual simulator."""
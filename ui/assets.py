@@ -0,0 +1,100 @@
+"""Header image assets, decoded and resized once per process.
+
+``st.image`` re-encodes a PIL image on every rerun in every session. Here each
+(path, mtime, size) is opened, thumbnailed and PNG-encoded a single time with
+``st.cache_resource``; sessions then share the same immutable bytes, which
+Streamlit serves from its media file store.
+"""
+import hashlib
+from io import BytesIO
+from pathlib import Path
+
+import streamlit as st
+
+from physics import files
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def asset_path(path):
+    """Resolve ``path`` against the repository root so the apps work from any cwd."""
+    p = Path(path)
+    return p if p.is_absolute() else ROOT / p
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _encode(path, mtime_ns, size):
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img = img.copy()
+    if size:
+        img.thumbnail(size, Image.LANCZOS)
+    buf = BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def image_bytes(path, size=None):
+    """Return PNG bytes of the image at ``path`` fitted into ``size``, or None if it can't be read.
+
+    The file's mtime is part of the cache key, so replacing an image on disk
+    is picked up without restarting the server.
+    """
+    p = asset_path(path)
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        return _encode(str(p), mtime_ns, tuple(size) if size else None)
+    except Exception:
+        return None
+
+
+# ---------------------------
+# PDF cover
+COVER_CACHE = ROOT / ".cache" / "covers"
+
+
+def _sha256(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _render_first_page(path, size):
+    import fitz
+
+    with fitz.open(path) as doc:
+        page = doc.load_page(0)
+        zoom = min(size[0] / page.rect.width, size[1] / page.rect.height)
+        return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom)).tobytes("png")
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _pdf_cover(path, mtime_ns, size):
+    cached = COVER_CACHE / f"{_sha256(path)[:24]}-{mtime_ns}-{size[0]}x{size[1]}.png"
+    if cached.exists():
+        return cached.read_bytes()
+    png = _render_first_page(path, size)
+    files.write_atomic(cached, lambda tmp: Path(tmp).write_bytes(png))
+    return png
+
+
+def pdf_cover_bytes(path, size):
+    """Return PNG bytes of the PDF's first page rendered to fit ``size``, or None if the PDF is missing.
+
+    Renders straight at the target resolution and keeps the result on disk
+    under ``.cache/covers``, keyed by the PDF's content hash and mtime, so a
+    server restart reuses it and ``fitz`` is only imported on a cache miss.
+    Render errors propagate to the caller.
+    """
+    p = asset_path(path)
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _pdf_cover(str(p), mtime_ns, tuple(size))
@@ -0,0 +1,173 @@
+// Drives the static chapter pages written by ui/export.py (see its docstring).
+//
+// The page data (<script id="chapter">) holds the controls, the figures at
+// their defaults and either lookup tables or the name of an evaluator below.
+// A table stores one output over a subset of the controls, row-major, so its
+// row is found from those controls' current positions alone.
+(function () {
+  "use strict";
+
+  const node = document.getElementById("chapter");
+  if (!node) return;  // the introduction and the equations have no controls
+  const data = JSON.parse(node.textContent);
+  const inputs = data.controls.map((c) => document.querySelector(`[name="${c.name}"]`));
+  const charts = data.figures.map((_, i) => document.getElementById(`figure-${i}`));
+  const config = { responsive: true, displaylogo: false };
+
+  // Python format specs used by the catalog templates: {x}, {x:.2f}, {x:g}, {x:,}
+  function format(template, slots) {
+    return template.replace(/\{(\w+)(?::([^}]*))?\}/g, (match, name, spec) => {
+      const value = slots[name];
+      if (value === undefined) return match;
+      if (!spec) return String(value);
+      if (spec === "g") return String(Number(value.toPrecision(6)));
+      if (spec === ",") return Math.round(value).toLocaleString("en-US");
+      const fixed = /^\.(\d+)f$/.exec(spec);
+      return fixed ? value.toFixed(Number(fixed[1])) : String(value);
+    });
+  }
+
+  function setPath(obj, path, value) {
+    for (const key of path.slice(0, -1)) obj = obj[key];
+    obj[path[path.length - 1]] = value;
+  }
+
+  function lookup(index) {
+    const texts = {}, slots = {};
+    for (const table of data.tables) {
+      let row = 0;
+      for (const axis of table.axes) row = row * data.controls[axis].values.length + index[axis];
+      const value = table.rows[row];
+      const [kind, ...path] = table.target;
+      if (kind === "fig") setPath(data.figures[path[0]], path.slice(1), value);
+      else if (kind === "text") texts[path[0]] = data.templates[value];
+      else (slots[path[0]] = slots[path[0]] || {})[path[1]] = value;
+    }
+    for (const [name, template] of Object.entries(texts)) {
+      document.getElementById(`text-${name}`).innerHTML = format(template, slots[name] || {});
+    }
+  }
+
+  // ---------------------------
+  // Evaluators: closed forms too large to tabulate, ported from physics/
+  function linspace(a, b, n) {
+    const x = new Float64Array(n);
+    for (let i = 0; i < n; i++) x[i] = n > 1 ? a + ((b - a) * i) / (n - 1) : a;
+    return x;
+  }
+
+  // sampling.minmax_downsample
+  function minmaxDownsample(x, y, nBuckets) {
+    const n = y.length;
+    if (n <= 2 * nBuckets) return [x, y];
+    const per = Math.floor(n / nBuckets), usable = per * nBuckets;
+    const size = 2 * nBuckets + (usable < n ? 1 : 0);
+    const xs = new Float64Array(size), ys = new Float64Array(size);
+    let k = 0;
+    for (let b = 0; b < nBuckets; b++) {
+      let iMin = b * per, iMax = iMin;
+      for (let i = b * per; i < (b + 1) * per; i++) {
+        if (y[i] < y[iMin]) iMin = i;
+        if (y[i] > y[iMax]) iMax = i;
+      }
+      for (const i of iMin <= iMax ? [iMin, iMax] : [iMax, iMin]) {
+        xs[k] = x[i];
+        ys[k++] = y[i];
+      }
+    }
+    if (usable < n) {
+      xs[k] = x[n - 1];
+      ys[k] = y[n - 1];
+    }
+    return [xs, ys];
+  }
+
+  const EVALUATORS = {
+    // kernels.grating: diffraction.pattern on kernels.grating_grid, peak-normalized and downsampled
+    double_slit(v, p, [fig]) {
+      const [lamNm, weights] = v.source === "mono" ? [[v.lam_nm], [1]] : p.spectra[v.source];
+      const d = v.d_mm * 1e-3, a = v.a_um * 1e-6, L = v.L, N = v.N;
+      const period = (Math.min(...lamNm) * 1e-9 * L) / d;
+      const perPeriod = Math.max(p.points_per_fringe, 4 * N);
+      const maxPoints = Math.min(p.max_points, Math.max(p.min_points, Math.floor(p.max_elements / lamNm.length)));
+      const wanted = Math.ceil(((2 * p.half_width_m) / period) * perPeriod) + 1;
+      const x = linspace(-p.half_width_m, p.half_width_m, Math.min(Math.max(wanted, p.min_points), maxPoints));
+      const I = new Float64Array(x.length);
+      for (let k = 0; k < lamNm.length; k++) {
+        const lam = lamNm[k] * 1e-9, w = weights[k];
+        for (let i = 0; i < x.length; i++) {
+          const path = x[i] / Math.sqrt(x[i] * x[i] + L * L) / lam;
+          let envelope = 1;
+          if (a > 0) {
+            const u = Math.PI * a * path;
+            envelope = u === 0 ? 1 : (Math.sin(u) / u) ** 2;
+          }
+          const gamma = Math.PI * d * path, den = N * Math.sin(gamma);
+          const grating = Math.abs(den) > 1e-9 ? Math.sin(N * gamma) / den : 1;
+          I[i] += w * envelope * grating * grating;
+        }
+      }
+      let peak = 0;
+      for (const value of I) peak = Math.max(peak, value);
+      for (let i = 0; i < I.length; i++) I[i] /= peak + 1e-12;
+      const [xs, ys] = minmaxDownsample(x, I, p.n_buckets);
+      fig.data[0].x = xs.map((value) => value * 1000);
+      fig.data[0].y = ys;
+    },
+
+    // kernels.box_evolution: ψ₁ + amp·ψ₂ in the infinite well (spectral.two_state), Eₙ = n², peak-normalized
+    box(v, p, [fig]) {
+      const x = linspace(0, p.L, p.n_x), t = linspace(0, p.t_max, p.n_frames);
+      const norm = Math.sqrt(2 / p.L);
+      const psi1 = x.map((xi) => norm * Math.sin((v.n1 * Math.PI * xi) / p.L));
+      const psi2 = x.map((xi) => norm * Math.sin((v.n2 * Math.PI * xi) / p.L));
+      const E1 = v.n1 * v.n1, E2 = v.n2 * v.n2;
+      fig.data[0].x = x;
+      t.forEach((ti, f) => {
+        const prob = new Float64Array(p.n_x);
+        let peak = 0;
+        for (let i = 0; i < p.n_x; i++) {
+          const re = psi1[i] * Math.cos(E1 * ti) + v.amp * psi2[i] * Math.cos(E2 * ti);
+          const im = -(psi1[i] * Math.sin(E1 * ti) + v.amp * psi2[i] * Math.sin(E2 * ti));
+          prob[i] = re * re + im * im;
+          peak = Math.max(peak, prob[i]);
+        }
+        for (let i = 0; i < p.n_x; i++) prob[i] /= peak + 1e-12;
+        fig.frames[f].data[0].y = prob;
+        if (f === 0) fig.data[0].y = prob;
+      });
+    },
+  };
+
+  // ---------------------------
+  function update() {
+    const index = inputs.map((input) => Number(input.value));
+    data.controls.forEach((control, i) => {
+      const output = inputs[i].parentElement.querySelector("output");
+      if (output) output.textContent = control.labels[index[i]];
+    });
+    lookup(index);
+    if (data.evaluator) {
+      const values = Object.fromEntries(data.controls.map((c, i) => [c.name, c.values[index[i]]]));
+      EVALUATORS[data.evaluator](values, data.params, data.figures);
+    }
+    data.figures.forEach((fig, i) => {
+      // New array objects are what Plotly.react diffs on; the revision makes it redraw regardless.
+      fig.layout.datarevision = (fig.layout.datarevision || 0) + 1;
+      Plotly.react(charts[i], { ...fig, config });
+    });
+  }
+
+  let pending = false;
+  function schedule() {
+    if (pending) return;
+    pending = true;
+    requestAnimationFrame(() => {
+      pending = false;
+      update();
+    });
+  }
+
+  for (const input of inputs) input.addEventListener("input", schedule);
+  update();
+})();
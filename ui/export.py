@@ -0,0 +1,488 @@
+"""Static, serverless export of every chapter for GitHub Pages.
+
+Run from the repository root:
+
+    python -m ui.export [--out docs] [--lang en fa]
+
+writes one HTML page per chapter and language (the default language at the
+top level, the others under ``<lang>/``) with a local ``plotly.min.js``, the
+header images and ``export.js``. Commit the output directory and point
+GitHub Pages at it. Nothing runs on a server: the controls are plain
+``<input>``/``<select>`` elements and the browser redraws the charts.
+
+* Relativity, the photoelectric effect and Bohr are cheap per slider
+  position, so they are *tabulated*: ``point`` builds the chapter's figures
+  and result text with the app's own kernels and figure builders at every
+  control combination, and each figure property, template and number is
+  stored only over the controls it actually varies with (the K_max line
+  depends on φ alone, the Bohr diagram on the series alone, ...). Data
+  arrays ship as Plotly's float32 base64 typed arrays.
+* The double slit and the well have far too many (parameter × sample)
+  combinations to tabulate, so ``export.js`` re-evaluates their closed-form
+  intensities in the browser; Python supplies the grids and source spectra.
+
+Numbers in result text are left as ``{name:.3f}``-style slots in the
+catalog templates and filled in by ``export.js``, so a template is stored
+once instead of once per slider position. Controls the static pages can't
+offer (the photocurrent, the photon-by-photon screen, the wave packets,
+the proper length and the Bohr n_max) keep their app defaults, except the
+relativity event count, which is cut from 2000 to ``REL_EVENTS`` to keep
+the tabulated page small; the page says so below the charts.
+"""
+import argparse
+import json
+import numbers
+import shutil
+import time
+from html import escape
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from ui import i18n, page
+
+SCRIPT = Path(__file__).with_suffix(".js")
+KATEX = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist"
+
+# Controls fixed in the static pages: the app defaults, except the event count
+# (2000 in the app), reduced because every v/c position stores its own scatter
+REL_L0 = 20.0
+REL_EVENTS = 200
+BOHR_N_MAX = 6
+
+
+# ---------------------------
+# Controls and text
+class Control(NamedTuple):
+    name: str
+    label: str
+    values: list
+    labels: list
+    default: int
+    kind: str
+
+
+def slider(name, label, axis, default):
+    """A range input over the values of a ``store.Axis``."""
+    decimals = len(f"{axis.step:g}".partition(".")[2])
+    values = [round(v, decimals) if decimals else int(round(v)) for v in axis.values()]
+    return Control(name, label, values, [f"{v:.{decimals}f}" for v in values], axis.index(default), "range")
+
+
+def choice(name, label, options, default=None):
+    """A select over a catalog's ``{label: key}`` options."""
+    keys = list(options.values())
+    return Control(name, label, keys, list(options), keys.index(default) if default else 0, "select")
+
+
+class Text(NamedTuple):
+    template: str
+    numbers: dict
+
+
+class _Slot:
+    def __init__(self, name):
+        self.name = name
+
+    def __format__(self, spec):
+        return f"{{{self.name}:{spec}}}" if spec else f"{{{self.name}}}"
+
+
+def text(template, **fields):
+    """``template.format(**fields)`` with the numeric fields left as slots for ``export.js``.
+
+    A field may itself be a ``Text``; its template is inlined and its numbers merged.
+    """
+    values, slots = {}, {}
+    for name, value in fields.items():
+        if isinstance(value, Text):
+            values.update(value.numbers)
+            slots[name] = value.template
+        elif isinstance(value, numbers.Real) and not isinstance(value, bool):
+            values[name] = int(value) if isinstance(value, numbers.Integral) else float(value)
+            slots[name] = _Slot(name)
+        else:
+            slots[name] = value
+    return Text(template.format(**slots), values)
+
+
+def fill(t):
+    """The HTML of ``t`` with its numbers formatted, for the page's initial state."""
+    return t.template.format(**t.numbers)
+
+
+ALERTS = {"info": "28,131,225", "success": "33,195,84", "warning": "255,189,69", "error": "255,43,43"}
+
+
+def alert(kind, html):
+    return f"<div class='alert' style='background:rgba({ALERTS[kind]},0.15)'>{html}</div>"
+
+
+def caption(html):
+    return f"<p class='caption'>{html}</p>"
+
+
+# ---------------------------
+# Chapters
+class Chapter(NamedTuple):
+    controls: list
+    point: object = None      # fn(**values) -> ([figures], {name: Text}), tabulated over every control
+    figures: list = ()        # evaluator chapters: the figures export.js fills in
+    evaluator: str = None
+    params: dict = None
+
+
+def relativity(T):
+    from physics import kernels, spacetime
+    from physics.store import Axis
+    from ui import figures
+
+    def point(v_frac, preset, frame):
+        gamma, L = kernels.relativity(v_frac, REL_L0)
+        level = "info" if v_frac < 0.3 else "warning" if v_frac < 0.7 else "error"
+        message = T["rel.negligible" if v_frac < 0.3 else "rel.significant" if v_frac < 0.7 else "rel.near_c"]
+        scene = kernels.spacetime_scene(preset, v_frac, REL_L0, frame, REL_EVENTS)
+        if preset == "rod":
+            story = text(T["rel.rod.caption"], L=L)
+        elif preset == "ladder":
+            barn = spacetime.BARN_RATIO * REL_L0
+            fits = T["rel.ladder.fits"] if L <= barn else T["rel.ladder.does_not_fit"]
+            story = text(T["rel.ladder.caption"], barn=barn, L=L, fits=fits, barn_moving=barn / gamma)
+        else:
+            story = text(T["rel.twin.caption"], home=2 * REL_L0, traveller=2 * REL_L0 / gamma)
+        names = T[f"rel.{preset}.names"] + (T["rel.simultaneity"], T["rel.key_events"])
+        return [figures.spacetime_diagram(scene, names)], {
+            "result": text(page.result_html(T, T["rel.result"]), var=page.VAR, gamma=gamma, L=L),
+            "alert": text(alert(level, message)),
+            "story": text(caption("{story}"), story=story),
+            "ticks": text(caption(T["rel.ticks"]), step=scene["step"]),
+        }
+
+    # v/c in 0.05 steps rather than the app's 0.01: every step is a whole spacetime diagram
+    return Chapter([slider("v_frac", T["rel.v"], Axis(0.0, 0.05, 20), 0.7),
+                    choice("preset", T["rel.scenario"], T["rel.presets"]),
+                    choice("frame", T["rel.draw_in"], T["rel.frames"])], point)
+
+
+def photoelectric(T):
+    from physics import kernels
+    from physics.store import Axis
+    from ui import figures
+
+    def point(freq_1e14, phi):
+        E, Kmax, f_axis, K_curve = kernels.photoelectric(freq_1e14, phi)
+        fig = figures.figure(
+            data=[figures.line(f_axis, K_curve, '#4a9eff'), figures.markers([freq_1e14], [Kmax], 'red')],
+            layout=figures.layout(500),
+        )
+        state = alert("success", T["pe.emitted"]) if E > phi else alert("error", T["pe.below"])
+        return [fig], {"result": text(page.result_html(T, T["pe.result"]), var=page.VAR, E=E, Kmax=Kmax),
+                       "alert": text(state)}
+
+    return Chapter([slider("freq_1e14", T["pe.freq"], Axis(1.0, 0.5, 199), 15.0),
+                    slider("phi", T["pe.phi"], Axis(1.0, 0.1, 41), 2.2)], point)
+
+
+def double_slit(T):
+    from physics import diffraction
+    from physics.store import Axis
+    from ui import figures
+
+    fig = figures.figure([figures.line([], [], '#87cefa')], figures.layout(500))
+    spectra = {}
+    for source in diffraction.SOURCES:
+        if source != "mono":
+            lam, weights = diffraction.spectrum(source)
+            spectra[source] = [lam.tolist(), weights.tolist()]
+    return Chapter(
+        [slider("d_mm", T["ds.d"], Axis(0.1, 0.01, 191), 0.5),
+         slider("lam_nm", T["ds.lam"], Axis(400, 10, 31), 550),
+         slider("L", T["ds.L"], Axis(0.5, 0.1, 46), 1.0),
+         slider("N", T["ds.N"], Axis(2, 1, 19), 2),
+         slider("a_um", T["ds.a"], Axis(0, 5, 41), 0),
+         choice("source", T["ds.source"], T["ds.sources"])],
+        figures=[fig], evaluator="double_slit",
+        # The kernels.grating / grating_grid defaults
+        params=dict(spectra=spectra, half_width_m=0.05, points_per_fringe=16, max_elements=4_000_000,
+                    min_points=1000, max_points=2_000_000, n_buckets=1500),
+    )
+
+
+def bohr(T):
+    from physics import hydrogen, kernels
+    from physics.store import Axis
+    from ui import figures
+
+    def series_name(n_f):
+        return T["bohr.series"].get(n_f) or hydrogen.series_name(n_f)
+
+    def point(n_f_max, n1, n2):
+        r1, dE, lam_nm, E1, E2 = kernels.bohr(n1, n2)
+        level_xy, line_xy, lines = kernels.hydrogen_diagram(BOHR_N_MAX, n_f_max)
+        if n1 == n2:
+            photon = text(T["bohr.no_transition"])
+        else:
+            kind = T["bohr.emission"] if n1 > n2 else T["bohr.absorption"]
+            photon = text(T["bohr.photon"], var=page.VAR, lam_nm=lam_nm, series=series_name(min(n1, n2)), kind=kind)
+        fig = figures.energy_diagram(level_xy, line_xy, n_f_max, E1, E2,
+                                     [series_name(k) for k in range(1, n_f_max + 1)])
+        return [fig], {
+            "result": text(page.result_html(T, T["bohr.result"]), var=page.VAR, r=r1, dE=dE, photon=photon),
+            "lines": text(caption(T["bohr.lines"]), n_lines=len(lines[0]), n_max=BOHR_N_MAX),
+        }
+
+    return Chapter([slider("n_f_max", T["bohr.n_f_max"], Axis(1, 1, 6), 3),
+                    slider("n1", T["bohr.n1"], Axis(1, 1, BOHR_N_MAX), 3),
+                    slider("n2", T["bohr.n2"], Axis(1, 1, BOHR_N_MAX), 2)], point)
+
+
+def box(T):
+    from physics.store import Axis
+    from ui import figures
+
+    params = dict(n_frames=100, t_max=4.0, n_x=500, L=1.0)  # kernels.box_evolution's defaults
+    t = np.linspace(0, params["t_max"], params["n_frames"])
+    fig = figures.animated_line([], [[]] * len(t), t, play_label=T["box.play"], pause_label=T["box.pause"], height=500)
+    return Chapter([slider("n1", T["box.n1"], Axis(1, 1, 5), 1),
+                    slider("n2", T["box.n2"], Axis(1, 1, 5), 2),
+                    slider("amp", T["box.amp"], Axis(0.0, 0.05, 21), 0.7)],
+                   figures=[fig], evaluator="box", params=params)
+
+
+CHAPTERS = {"relativity": relativity, "photoelectric": photoelectric, "double_slit": double_slit,
+            "bohr": bohr, "box": box}
+
+
+# ---------------------------
+# Tabulation
+def _figure_json(fig, template=True):
+    """Plotly JSON of ``fig`` with float arrays as float32 typed arrays."""
+    spec = fig.to_plotly_json()
+    if not template:
+        spec["layout"].pop("template", None)
+    return json.loads(pio.json.to_json_plotly(_float32(spec)))
+
+
+def _float32(obj):
+    if isinstance(obj, dict):
+        return {k: _float32(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_float32(v) for v in obj]
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == "f":
+        return obj.astype(np.float32)
+    return obj
+
+
+def _leaves(obj, path=()):
+    """``(path, value)`` for every property of a figure's JSON; typed arrays and value lists are leaves."""
+    if isinstance(obj, dict) and "bdata" not in obj:
+        for key, value in obj.items():
+            yield from _leaves(value, path + (key,))
+    elif isinstance(obj, list) and obj and all(isinstance(v, dict) for v in obj):
+        for i, value in enumerate(obj):
+            yield from _leaves(value, path + (i,))
+    else:
+        yield path, obj
+
+
+def tabulate(chapter):
+    """Evaluate ``chapter.point`` over every control combination.
+
+    Returns ``(figures, texts, templates, tables)``: the figures and text
+    at the controls' defaults, and one table per output, reduced to the
+    controls it varies with. Figure properties that never change are left
+    out; they are already in the default figures.
+    """
+    controls = chapter.controls
+    shape = tuple(len(c.values) for c in controls)
+    default = tuple(c.default for c in controls)
+    # A property missing at some combinations (a slot only one scenario's caption uses) is null there.
+    templates, cells, encoded = {}, {}, {None: None}
+
+    def put(target, index, value):
+        key = json.dumps(value, sort_keys=True)
+        encoded.setdefault(key, value)
+        cells.setdefault(target, np.empty(shape, dtype=object))[index] = key
+
+    for index in np.ndindex(*shape):
+        figs, texts = chapter.point(**{c.name: c.values[i] for c, i in zip(controls, index)})
+        if index == default:
+            defaults = [_figure_json(fig) for fig in figs], texts
+        for i, fig in enumerate(figs):
+            for path, value in _leaves(_figure_json(fig, template=False)):
+                put(("fig", i) + path, index, value)
+        for name, t in texts.items():
+            put(("text", name), index, templates.setdefault(t.template, len(templates)))
+            for key, value in t.numbers.items():
+                put(("slot", name, key), index, value)
+
+    tables = []
+    for target, table in cells.items():
+        axes = list(range(len(shape)))
+        for axis in reversed(range(len(shape))):
+            first = np.take(table, [0], axis=axis)
+            if (table == first).all():
+                table = first
+                axes.remove(axis)
+        if target[0] == "fig" and not axes:
+            continue
+        tables.append(dict(axes=axes, target=list(target), rows=[encoded[k] for k in table.ravel()]))
+    return defaults[0], defaults[1], list(templates), tables
+
+
+# ---------------------------
+# Pages
+STYLE = """
+body { margin:0; background:#0e1117; color:#fafafa; font-family:"Source Sans Pro", system-ui, sans-serif; }
+.app { display:flex; min-height:100vh; }
+nav { flex:0 0 240px; background:#262730; padding:24px 16px; }
+nav h3 { margin-top:0; }
+nav a { display:block; color:#fafafa; text-decoration:none; padding:6px 10px; border-radius:6px; }
+nav a.current { background:#0e1117; color:#4a9eff; }
+nav .languages { margin-top:24px; border-top:1px solid #444; padding-top:12px; }
+main { flex:1; min-width:0; max-width:1200px; padding:24px 48px; }
+header { display:grid; grid-template-columns:20% 60% 20%; align-items:center; gap:12px; }
+header img { max-width:100%; }
+hr { border:0; border-top:1px solid #444; margin:24px 0; }
+.eq { direction:ltr; text-align:center; font-size:1.2em; margin:12px 0; }
+.controls { display:grid; grid-template-columns:repeat(auto-fit, minmax(260px, 1fr)); gap:12px 32px; margin:16px 0; }
+.controls label { display:flex; flex-direction:column; gap:6px; font-size:14px; }
+.controls output { color:#87cefa; font-weight:bold; }
+.controls input[type=range] { direction:ltr; width:100%; accent-color:#ff4b4b; }
+.controls select { background:#262730; color:#fafafa; border:1px solid #444; border-radius:6px; padding:6px; }
+.alert { padding:12px 16px; border-radius:8px; margin:8px 0; }
+.caption { color:#a3a8b8; font-size:14px; }
+.chart { direction:ltr; }
+.note { color:#a3a8b8; font-size:13px; font-style:italic; margin-top:24px; }
+"""
+
+
+def _control_html(control):
+    label = escape(control.label)
+    current = escape(control.labels[control.default])
+    if control.kind == "range":
+        return (f"<label>{label} <output>{current}</output><input type='range' name='{control.name}' "
+                f"min='0' max='{len(control.values) - 1}' step='1' value='{control.default}'></label>")
+    options = "".join(f"<option value='{i}'{' selected' if i == control.default else ''}>{escape(text)}</option>"
+                      for i, text in enumerate(control.labels))
+    return f"<label>{label}<select name='{control.name}'>{options}</select></label>"
+
+
+def panel_html(T, chapter):
+    """Controls, text outputs, chart containers and the page data for ``export.js``."""
+    if chapter.point:
+        figs, texts, templates, tables = tabulate(chapter)
+    else:
+        figs, texts, templates, tables = [_figure_json(fig) for fig in chapter.figures], {}, [], []
+    data = dict(controls=[dict(name=c.name, values=c.values, labels=c.labels) for c in chapter.controls],
+                figures=figs, templates=templates, tables=tables,
+                evaluator=chapter.evaluator, params=chapter.params)
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    return "\n".join([
+        "<div class='controls'>", *map(_control_html, chapter.controls), "</div>",
+        *(f"<div id='text-{name}'>{fill(t)}</div>" for name, t in texts.items()),
+        *(f"<div class='chart' id='figure-{i}'></div>" for i in range(len(figs))),
+        f"<p class='note'>{T['static.note']}</p>",
+        f"<script id='chapter' type='application/json'>{payload}</script>",
+    ])
+
+
+def chapter_html(T, key):
+    if key == "intro":
+        return page.title_html(T["intro.title"], center=True) + page.intro_html(T)
+    if key == "equations":
+        return page.title_html(T["eq.title"]) + _latex_html(T, "eq")
+    section = {"relativity": "rel", "photoelectric": "pe", "double_slit": "ds"}.get(key, key)
+    heading = "key_equations" if key == "relativity" else "equations"
+    return "\n".join([page.title_html(T[section + ".title"]), page.lesson_html(T, section, heading),
+                      _latex_html(T, section), panel_html(T, CHAPTERS[key](T))])
+
+
+def _latex_html(T, key):
+    return "".join(f"<div class='eq'>$${escape(eq)}$$</div>" for eq in page.latex(T, key))
+
+
+def filename(key):
+    return "index.html" if key == "intro" else f"{key}.html"
+
+
+def document(T, code, key, body, root):
+    label = next(label for label, k in T["chapters"].items() if k == key)
+    links = "".join(f"<a href='{filename(k)}'{' class=current' if k == key else ''}>{escape(text)}</a>"
+                    for text, k in T["chapters"].items())
+    languages = "".join(
+        f"<a href='{root}{'' if other == i18n.DEFAULT else other + '/'}{filename(key)}'"
+        f"{' class=current' if other == code else ''}>{escape(strings['language'])}</a>"
+        for other, strings in i18n.CATALOGS.items())
+    return f"""<!DOCTYPE html>
+<html lang="{code}" dir="{'rtl' if T['rtl'] else 'ltr'}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(label)} — {escape(T['page_title'])}</title>
+<link rel="stylesheet" href="{KATEX}/katex.min.css">
+<script defer src="{KATEX}/katex.min.js"></script>
+<script defer src="{KATEX}/contrib/auto-render.min.js" onload="renderMathInElement(document.body)"></script>
+<script src="{root}plotly.min.js"></script>
+<style>{STYLE}</style>
+</head>
+<body>
+<div class="app">
+<nav><h3>{escape(T['sidebar.title'])}</h3>{links}<div class="languages">{languages}</div></nav>
+<main>
+<header><img src="{root}logo.png" alt=""><div>{page.header_html(T)}</div><img src="{root}cover-{code}.png" alt=""></header>
+<hr>
+{body}
+</main>
+</div>
+<script src="{root}export.js"></script>
+</body>
+</html>
+"""
+
+
+def write_assets(out, codes):
+    from ui import assets
+
+    (out / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+    shutil.copyfile(SCRIPT, out / "export.js")
+    (out / "logo.png").write_bytes(assets.image_bytes("logo.png", (160, 200)))
+    for code in codes:
+        cover_pdf = i18n.CATALOGS[code]["cover_pdf"]
+        try:
+            cover = assets.pdf_cover_bytes(cover_pdf, (200, 200)) if cover_pdf else None
+        except Exception:
+            cover = None
+        (out / f"cover-{code}.png").write_bytes(cover or assets.image_bytes("cover.png", (200, 200)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every chapter as static HTML for GitHub Pages.")
+    parser.add_argument("--out", default="docs", help="output directory (default: docs)")
+    parser.add_argument("--lang", nargs="*", default=list(i18n.CATALOGS), choices=list(i18n.CATALOGS))
+    args = parser.parse_args()
+
+    # Outside ``streamlit run`` every cached function warns that there is no runtime.
+    from streamlit.logger import get_logger
+    for name in ("cache_data_api", "cache_resource_api"):
+        get_logger(f"streamlit.runtime.caching.{name}").setLevel("ERROR")
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    write_assets(out, args.lang)
+    for code in args.lang:
+        T = i18n.CATALOGS[code]
+        directory, root = (out, "") if code == i18n.DEFAULT else (out / code, "../")
+        directory.mkdir(exist_ok=True)
+        for key in T["chapters"].values():
+            start = time.perf_counter()
+            html = document(T, code, key, chapter_html(T, key), root)
+            (directory / filename(key)).write_text(html, encoding="utf-8")
+            print(f"{code} {key:<14} {len(html.encode()) / 1024:>8.1f} KiB in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
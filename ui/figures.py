@@ -0,0 +1,289 @@
+"""Plotly figure builders shared by both apps.
+
+The dark theme is registered once per process as the ``modern_physics``
+template. Each chapter's layout is a cached skeleton (axes, subplot domains,
+template, height); a rerun only supplies fresh trace data, and
+``figure()`` assembles the two without running Plotly's property validators,
+which otherwise dominate figure construction time.
+
+``figure()`` also compacts the trace data. Plotly 6 and later serialize
+NumPy arrays as base64 typed arrays; there, float64 arrays are cast to
+float32 (about seven significant digits, far below a pixel), which halves
+their share of the payload. Older Plotly versions write arrays as JSON
+number lists, and those are left as they are.
+"""
+from functools import lru_cache
+
+import numpy as np
+import plotly
+import plotly.graph_objs as go
+import plotly.io as pio
+
+TEMPLATE = "modern_physics"
+BG = "#0b1a33"
+FG = "#e6f2ff"
+
+pio.templates[TEMPLATE] = go.layout.Template(layout=dict(
+    paper_bgcolor=BG, plot_bgcolor=BG, font=dict(color=FG),
+))
+
+
+@lru_cache(maxsize=1)
+def template():
+    """The resolved template object: Streamlit's chart theme with ours on top, when Streamlit is loaded."""
+    name = f"streamlit+{TEMPLATE}" if "streamlit" in pio.templates else TEMPLATE
+    return pio.templates[name]
+
+
+TYPED_ARRAYS = int(plotly.__version__.split(".")[0]) >= 6
+
+
+def compact(trace):
+    """A trace dict with every float array (nested ones included) cast to float32; other values are kept."""
+    if not TYPED_ARRAYS:
+        return trace
+    out = {}
+    for key, value in trace.items():
+        if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+            value = value.astype(np.float32, copy=False)
+        elif isinstance(value, dict):
+            value = compact(value)
+        out[key] = value
+    return out
+
+
+def payload_bytes(fig):
+    """Approximate wire size of ``fig``'s trace data: base64 for arrays, JSON for the rest (layout excluded)."""
+    total = 0
+    for trace in [*fig.data, *(t for frame in fig.frames for t in frame.data)]:
+        for value in trace.to_plotly_json().values():
+            if isinstance(value, np.ndarray) and TYPED_ARRAYS:
+                total += 4 * -(-value.nbytes // 3)
+            elif isinstance(value, dict) and "bdata" in value:
+                total += len(value["bdata"])
+            elif isinstance(value, (np.ndarray, list, tuple)):
+                total += len(pio.json.to_json_plotly(value))
+    return total
+
+
+def figure(data, layout, frames=None):
+    """Assemble a ``go.Figure`` from trace/layout dicts, skipping validation.
+
+    Trace dicts must carry ``type``; their float arrays are compacted (see
+    the module docstring). ``layout`` is copied by Plotly, so the cached
+    skeletons below are safe to share between sessions.
+    """
+    spec = dict(data=[compact(trace) for trace in data], layout=layout)
+    if frames is not None:
+        spec["frames"] = [dict(frame, data=[compact(trace) for trace in frame["data"]]) for frame in frames]
+    return go.Figure(spec, _validate=False)
+
+
+# Trace/shape dicts are sent as-is, so nested properties must be spelled out
+# (``line=dict(width=...)``); Plotly's ``line_width`` shorthand is a validator feature.
+def line(x, y, color, width=None, **kwargs):
+    style = dict(color=color) if width is None else dict(color=color, width=width)
+    return dict(type="scatter", mode="lines", x=x, y=y, line=style, **kwargs)
+
+
+def segments(x, y, color, width=1, opacity=1.0):
+    """Many disjoint line segments (NaN-separated ``x``/``y``) as one WebGL trace."""
+    return dict(type="scattergl", mode="lines", x=x, y=y, line=dict(color=color, width=width),
+                opacity=opacity, hoverinfo="skip", showlegend=False)
+
+
+def markers(x, y, color, size=12, **kwargs):
+    return dict(type="scatter", mode="markers", x=x, y=y, marker=dict(size=size, color=color), **kwargs)
+
+
+# ---------------------------
+# Layout skeletons
+@lru_cache(maxsize=32)
+def layout(height, reversed_y=False, margin=None):
+    """Single-axis layout; ``margin`` is an (l, r, t, b) tuple."""
+    skeleton = dict(template=template(), height=height)
+    if reversed_y:
+        skeleton["yaxis"] = dict(autorange="reversed")
+    if margin is not None:
+        skeleton["margin"] = dict(zip("lrtb", margin))
+    return skeleton
+
+
+@lru_cache(maxsize=8)
+def stacked_layout(height, row_heights=(0.4, 0.6)):
+    """Two rows sharing the width, as ``make_subplots(rows=2, cols=1)`` lays them out.
+
+    Traces and shapes in the lower row use ``xaxis="x2", yaxis="y2"``.
+    """
+    from plotly.subplots import make_subplots
+
+    grid = make_subplots(rows=len(row_heights), cols=1, row_heights=list(row_heights))
+    skeleton = grid.layout.to_plotly_json()
+    skeleton.pop("template", None)
+    skeleton.update(template=template(), height=height)
+    return skeleton
+
+
+def rect(x0, x1, y0, y1, color, opacity=0.3, row=1):
+    suffix = "" if row == 1 else str(row)
+    return dict(type="rect", x0=x0, x1=x1, y0=y0, y1=y1, fillcolor=color, opacity=opacity,
+                xref=f"x{suffix}", yref=f"y{suffix}")
+
+
+# ---------------------------
+# Animation
+def animation_controls(play_label="Play", pause_label="Pause", frame_ms=50):
+    """Return ``updatemenus`` with play/pause buttons that run the frames in the browser."""
+    play = dict(frame=dict(duration=frame_ms, redraw=False), transition=dict(duration=0),
+                fromcurrent=True, mode="immediate")
+    pause = dict(frame=dict(duration=0, redraw=False), transition=dict(duration=0), mode="immediate")
+    return [dict(
+        type="buttons", direction="left", showactive=False,
+        x=0.0, y=1.12, xanchor="left", yanchor="top",
+        buttons=[
+            dict(label=play_label, method="animate", args=[None, play]),
+            dict(label=pause_label, method="animate", args=[[None], pause]),
+        ],
+    )]
+
+
+def animated_line(x, frames, t=None, color="#90ee90", play_label="Play", pause_label="Pause",
+                  frame_ms=50, height=500, margin=None, background=()):
+    """One figure holding every row of ``frames`` as a Plotly animation frame.
+
+    The first row is drawn as the initial trace, so the still figure is the
+    t = 0 state. Only ``y`` changes between frames; ``x`` is sent once.
+    ``background`` traces are drawn after it and stay fixed.
+    """
+    names = [f"{ti:.2f}" for ti in t] if t is not None else [str(i) for i in range(len(frames))]
+    step = dict(frame=dict(duration=0, redraw=False), mode="immediate")
+    return figure(
+        data=[line(x, frames[0], color), *background],
+        layout=dict(
+            layout(height, margin=margin),
+            yaxis=dict(range=[0, 1.05]),
+            updatemenus=animation_controls(play_label, pause_label, frame_ms),
+            sliders=[dict(
+                active=0, x=0.0, len=1.0, pad=dict(t=40), currentvalue=dict(prefix="t = "),
+                steps=[dict(label=name, method="animate", args=[[name], step]) for name in names],
+            )],
+        ),
+        frames=[dict(data=[dict(type="scatter", y=y)], name=name) for y, name in zip(frames, names)],
+    )
+
+
+# ---------------------------
+# Raster images
+def image_figure(source, x0, x1, y0, y1, height=300, xaxis_title=None, yaxis_title=None):
+    """An empty chart whose plot area is the image ``source`` (a URL or data URI) stretched over the given ranges."""
+    return figure(
+        data=[dict(type="scatter", x=[x0, x1], y=[y0, y1], mode="markers", marker=dict(opacity=0),
+                   hoverinfo="skip", showlegend=False)],
+        layout=dict(
+            layout(height),
+            xaxis=dict(range=[x0, x1], showgrid=False, zeroline=False, title=xaxis_title),
+            yaxis=dict(range=[y0, y1], showgrid=False, zeroline=False, title=yaxis_title),
+            images=[dict(source=source, xref="x", yref="y", x=x0, y=y1, sizex=x1 - x0, sizey=y1 - y0,
+                         sizing="stretch", layer="below")],
+        ),
+    )
+
+
+# ---------------------------
+# Energy-level diagram
+def energy_diagram(level_xy, line_xy, n_f_max, E1, E2, series_labels, height=500):
+    """Bohr levels and emission lines (one WebGL trace each) with the n₁ and n₂ levels highlighted."""
+    return figure(
+        data=[
+            segments(*level_xy, "#555", width=2),
+            segments(*line_xy, "#4a9eff", width=1, opacity=0.5),
+            line([0, n_f_max], [E1, E1], "#ffd700", width=5, showlegend=False),
+            line([0, n_f_max], [E2, E2], "#87cefa", width=5, showlegend=False),
+        ],
+        layout=dict(
+            layout(height),
+            xaxis=dict(range=[0, n_f_max], tickvals=[k + 0.5 for k in range(n_f_max)],
+                       ticktext=list(series_labels), showgrid=False, zeroline=False),
+            yaxis=dict(title="E (eV)"),
+        ),
+    )
+
+
+# ---------------------------
+# Spacetime diagram
+# Event-cloud colours by interval class (−1 spacelike, 0 lightlike, 1 timelike).
+INTERVAL_COLORS = ("#777", "#ffd700", "#90ee90")
+
+
+def spacetime_diagram(scene, names, height=600):
+    """A ``spacetime.scene`` as one trace per layer, on equal x / ct scales so light travels at 45°.
+
+    ``names`` labels the legend: (rest worldlines, moving worldlines,
+    simultaneity lines, key events).
+    """
+    rest_name, moving_name, sim_name, events_name = names
+    cloud_colors = np.asarray(INTERVAL_COLORS)[scene["cloud_class"] + 1].tolist()
+    return figure(
+        data=[
+            segments(*scene["grid_rest"], "#4a9eff", opacity=0.25),
+            segments(*scene["grid_moving"], "#ff6b6b", opacity=0.25),
+            dict(type="scattergl", mode="markers", x=scene["cloud"][0], y=scene["cloud"][1],
+                 marker=dict(size=3, color=cloud_colors, opacity=0.6), hoverinfo="skip", showlegend=False),
+            segments(*scene["cone"], "#ffd700", width=1, opacity=0.8),
+            dict(segments(*scene["simultaneity"], "#e6f2ff", width=1), name=sim_name, showlegend=True,
+                 line=dict(color="#e6f2ff", width=1, dash="dash")),
+            line(*scene["rest"], "#4a9eff", width=3, name=rest_name),
+            line(*scene["moving"], "#ff6b6b", width=3, name=moving_name),
+            markers(*scene["ticks"], "#e6f2ff", size=5, hoverinfo="skip", showlegend=False),
+            markers(*scene["events"], "#ffd700", size=11, name=events_name),
+        ],
+        layout=dict(
+            layout(height),
+            xaxis=dict(range=list(scene["x_range"]), title="x", zeroline=False, showgrid=False),
+            yaxis=dict(range=list(scene["ct_range"]), title="ct", zeroline=False, showgrid=False,
+                       scaleanchor="x", scaleratio=1),
+            legend=dict(orientation="h", y=-0.15),
+        ),
+    )
+
+
+# ---------------------------
+# Photon build-up
+def photon_build_up(x0, x1, counts, expected, last_xy, height=600):
+    """Latest individual hits (top strip) over the running histogram and its expected counts."""
+    n_bins = len(counts)
+    centers = x0 + (np.arange(n_bins) + 0.5) * ((x1 - x0) / n_bins)
+    # Overrides merge into the skeleton's axes, which carry the row domains and anchors.
+    skeleton = stacked_layout(height, row_heights=(0.25, 0.75))
+    return figure(
+        data=[
+            dict(type="scattergl", mode="markers", x=last_xy[:, 0], y=last_xy[:, 1],
+                 marker=dict(size=3, color="#ffd700"), hoverinfo="skip", showlegend=False),
+            dict(type="bar", x=centers, y=counts, marker=dict(color="#87cefa", line=dict(width=0)),
+                 width=(x1 - x0) / n_bins, xaxis="x2", yaxis="y2", showlegend=False),
+            line(centers, expected, "#ff6b6b", width=1, xaxis="x2", yaxis="y2", showlegend=False),
+        ],
+        layout=dict(
+            skeleton,
+            xaxis=dict(skeleton["xaxis"], range=[x0, x1], showticklabels=False, showgrid=False, zeroline=False),
+            yaxis=dict(skeleton["yaxis"], range=[0, 1], showticklabels=False, showgrid=False, zeroline=False),
+            xaxis2=dict(skeleton["xaxis2"], range=[x0, x1], title="x (mm)"),
+            bargap=0,
+        ),
+    )
+
+
+# ---------------------------
+# Photocurrent
+def iv_curve(V, I, V_stop, height=400):
+    """Photocurrent against anode voltage, with the ideal stopping potential marked."""
+    return figure(
+        data=[line(V, I, "#4a9eff", width=2)],
+        layout=dict(
+            layout(height),
+            xaxis=dict(title="V (V)"),
+            yaxis=dict(title="I (pA)", rangemode="tozero"),
+            shapes=[dict(type="line", x0=V_stop, x1=V_stop, y0=0, y1=1, yref="paper",
+                         line=dict(color="#ff6b6b", width=1, dash="dash"))],
+        ),
+    )
@@ -0,0 +1,58 @@
+"""Per-session language selection for the bilingual app.
+
+One server process serves both languages, so every session shares the same
+``st.cache_data`` entries, kernels and header images; only the strings and
+the text direction differ. The language comes from, in order:
+
+* the sidebar selector, once the session has rendered it;
+* ``?lang=en`` / ``?lang=fa`` in the URL;
+* ``st.session_state["locale"]`` set before the app runs (the old Persian
+  entry point does this);
+* English.
+
+The choice is written back to ``?lang=`` so a reload or a shared link
+keeps it.
+"""
+import streamlit as st
+
+from ui.locales import en, fa
+
+CATALOGS = {"en": en.STRINGS, "fa": fa.STRINGS}
+DEFAULT = "en"
+LANGUAGES = {strings["language"]: code for code, strings in CATALOGS.items()}
+
+# Prose, widget labels, alerts and the sidebar run right to left; equations and charts stay left to right.
+RTL_CSS = """
+<style>
+[data-testid="stMain"] [data-testid="stMarkdownContainer"],
+[data-testid="stMain"] [data-testid="stCaptionContainer"],
+[data-testid="stWidgetLabel"], [data-testid="stAlert"], [data-testid="stSidebarContent"] {
+    direction: rtl; text-align: right;
+}
+[data-testid="stMain"] .katex-display { direction: ltr; }
+</style>
+"""
+
+
+def _initial():
+    code = st.query_params.get("lang") or st.session_state.get("locale")
+    return code if code in CATALOGS else DEFAULT
+
+
+def select():
+    """Render the language selector in the sidebar and return the session's catalog."""
+    if "language" not in st.session_state:
+        st.session_state["language"] = CATALOGS[_initial()]["language"]
+    code = LANGUAGES[st.sidebar.selectbox("Language · زبان", list(LANGUAGES), key="language")]
+    st.session_state["locale"] = code
+    if st.query_params.get("lang") != code:
+        st.query_params["lang"] = code
+    strings = CATALOGS[code]
+    if strings["rtl"]:
+        st.markdown(RTL_CSS, unsafe_allow_html=True)
+    return strings
+
+
+def strings():
+    """The catalog ``select()`` chose for this session, for the chapter pages."""
+    return CATALOGS[st.session_state.get("locale", DEFAULT)]
@@ -0,0 +1,7 @@
+"""String catalogs for the simulator, one module per language.
+
+Each module defines ``STRINGS``: plain text and small HTML fragments keyed
+by ``"<section>.<name>"``, formatted with ``str.format`` by the app, plus
+the label → key dicts behind its radios and select boxes. Keys are the same
+in every catalog; labels are what the user sees.
+"""
@@ -0,0 +1,158 @@
+"""English strings."""
+
+STRINGS = {
+    "language": "English",
+    "rtl": False,
+    "music": True,
+    "cover_pdf": None,
+    "page_title": "Modern Physics Simulator — Mohammad Imani",
+    "header.title": "Modern Physics Interactive Simulator",
+    "header.byline": "<b>Mohammad Imani</b> — Based on <i>Krane, Modern Physics (2nd Ed.)</i>",
+    "cover_error": "Could not extract the cover: {error}",
+    "sidebar.title": "Chapters",
+    "chapters": {
+        "Introduction": "intro",
+        "1 — Special Relativity": "relativity",
+        "2 — Photoelectric Effect": "photoelectric",
+        "3 — Double-Slit Interference": "double_slit",
+        "4 — Bohr Model": "bohr",
+        "5 — Particle in a Box": "box",
+        "Key Equations": "equations",
+    },
+    "lesson": "Lesson:",
+    "equations": "Equations:",
+    "key_equations": "Key Equations:",
+    "unit.ev": "eV",
+
+    # Introduction
+    "intro.title": "Introduction",
+    "intro.body": """This interactive web application simulates key concepts from <b>Modern Physics</b> by Kenneth S. Krane (2nd Edition).
+    Each chapter includes:
+    <ul>
+    <li>Comprehensive lesson (5+ lines)</li>
+    <li>Interactive controls and real-time explanations</li>
+    <li>High-quality Plotly visualizations</li>
+    <li>Accurate equations from the textbook</li>
+    </ul>""",
+    "intro.credits": """<b>Department of Physics, University of Zanjan</b><br><br>
+    Special thanks to:<br>
+    <b>Dr. Reza Rasouli</b>, Faculty Member, University of Zanjan<br>
+    <b>Dr. Mojtaba Nasiri</b>, Head of Physics Department, University of Zanjan""",
+
+    # 1. Special Relativity
+    "rel.title": "Chapter 1 — Special Relativity",
+    "rel.lesson": """Einstein's special relativity shows that space and time are not absolute. At speeds near light, length contracts, time dilates, and mass increases. These effects become significant only when v > 0.1c.<br><br>
+    Two postulates: 1) Laws of physics are the same in all inertial frames. 2) Speed of light in vacuum is constant for all observers (c = 3×10⁸ m/s).""",
+    "rel.presets": {"Moving rod": "rod", "Ladder in the barn": "ladder", "Twin paradox": "twin"},
+    "rel.frames": {"Rest frame S": "rest", "Moving frame S′": "moving"},
+    "rel.v": "v/c",
+    "rel.L0": "Proper length L₀ (m)",
+    "rel.result": "γ = <span style='{var}'>{gamma:.4f}</span> | L = <span style='{var}'>{L:.2f} m</span>",
+    "rel.negligible": "Negligible relativity",
+    "rel.significant": "Significant contraction",
+    "rel.near_c": "Near c! γ > 2",
+    "rel.scenario": "Scenario",
+    "rel.draw_in": "Draw in",
+    "rel.events": "Background events",
+    "rel.rod.names": ("Rod at rest", "Moving rod"),
+    "rel.rod.caption": ("In S the moving rod's ends at ct = 0 are L₀/γ = {L:.2f} m apart. "
+                        "Dashed lines join events each frame calls simultaneous."),
+    "rel.ladder.names": ("Barn doors", "Ladder ends"),
+    "rel.ladder.fits": "fits",
+    "rel.ladder.does_not_fit": "does not fit",
+    "rel.ladder.caption": ("Barn: {barn:.1f} m. In the barn frame the {L:.2f} m ladder {fits} when both doors "
+                           "close at ct = 0; in the ladder frame the barn is {barn_moving:.2f} m and the doors "
+                           "do not close together."),
+    "rel.twin.names": ("Home twin", "Travelling twin"),
+    "rel.twin.caption": ("The home twin ages {home:.1f} m/c, the traveller {traveller:.1f} m/c. "
+                         "The dashed lines show the traveller's 'now' jumping at the turnaround."),
+    "rel.ticks": ("Dots mark every {step:g} m/c of proper time; background events are green inside "
+                  "the origin's light cone and grey outside it in every frame."),
+    "rel.simultaneity": "Simultaneity",
+    "rel.key_events": "Key events",
+
+    # 2. Photoelectric Effect
+    "pe.title": "Chapter 2 — Photoelectric Effect",
+    "pe.lesson": """Einstein showed light behaves as photons with energy E = h f. If photon energy exceeds work function φ, electrons are ejected. Maximum kinetic energy: K_max = h f - φ.<br><br>
+    Key insight: Light intensity affects number of photons (current), not energy. K_max depends only on frequency.""",
+    "pe.freq": "Frequency (×10¹⁴ Hz)",
+    "pe.phi": "Work function φ (eV)",
+    "pe.result": ("E = <span style='{var}'>{E:.3f} eV</span> | "
+                  "K_max = <span style='{var}'>{Kmax:.3f} eV</span>"),
+    "pe.emitted": "Electrons emitted",
+    "pe.below": "Below threshold",
+    "pe.power": "Light power P (nW)",
+    "pe.photocurrent": ("{n_photons:,} photons in 1 ms → {n_emitted:,} electrons emitted. The current stops at "
+                        "V = −{V_stop:.2f} V; the ideal stopping potential is −K_max/e = −{Kmax:.2f} V (dashed)."),
+
+    # 3. Double-Slit Interference
+    "ds.title": "Chapter 3 — Double-Slit Interference",
+    "ds.lesson": """Young's experiment proved light is a wave. Two slits act as coherent sources. Path difference Δ = d sinθ determines constructive/destructive interference. Bright fringes at Δ = mλ, dark at (m+½)λ.<br><br>
+    Fringe spacing Δx ≈ λL/d. Increasing d or decreasing λ reduces spacing.""",
+    "ds.sources": {"Monochromatic (λ slider)": "mono", "White light 400–700 nm": "white",
+                   "Sodium doublet": "sodium", "Hydrogen Balmer lines": "hydrogen"},
+    "ds.d": "Slit separation d (mm)",
+    "ds.lam": "Wavelength λ (nm)",
+    "ds.L": "Screen distance L (m)",
+    "ds.N": "Number of slits N",
+    "ds.a": "Slit width a (µm, 0 = ideal point slits)",
+    "ds.source": "Light source",
+    "ds.h": "Slit height h (µm)",
+    "ds.view": "View",
+    "ds.views": {"Wave pattern": "wave", "Photon by photon": "photons"},
+    "ds.screen": "Screen as seen in the lab (x × y, colour from the source spectrum)",
+    "ds.reset": "Reset",
+    "ds.detected": "{total:,} photons detected; the red curve is the expected count for the current pattern.",
+
+    # 4. Bohr Model
+    "bohr.title": "Chapter 4 — Bohr Model",
+    "bohr.lesson": """Bohr proposed electrons orbit in quantized states with radius r_n = n² a_0. Energy levels: E_n = -13.6/n² eV. Transitions emit/absorb photons with hν = |E_i - E_f|.<br><br>
+    This explains hydrogen spectrum and resolves classical collapse paradox.""",
+    "bohr.series": {},
+    "bohr.n_max": "Highest level n_max",
+    "bohr.n_f_max": "Series shown (final level n_f ≤)",
+    "bohr.n1": "Initial state n₁",
+    "bohr.n2": "Final state n₂",
+    "bohr.no_transition": "no transition",
+    "bohr.emission": "emission",
+    "bohr.absorption": "absorption",
+    "bohr.photon": "λ = <span style='{var}'>{lam_nm:.1f} nm</span> ({series} {kind})",
+    "bohr.result": ("r = <span style='{var}'>{r:.1f} Å</span> | "
+                    "ΔE = <span style='{var}'>{dE:.3f} eV</span> | {photon}"),
+    "bohr.lines": "{n_lines} emission lines drawn from {n_max} levels",
+
+    # 5. Particle in a Box
+    "box.title": "Chapter 5 — Particle in Infinite Well",
+    "box.lesson": """A particle in an infinite well can only have wavelengths that fit: λ_n = 2L/n. This leads to quantized energy E_n ∝ n². Superposition of two states with different n causes time-dependent probability density.<br><br>
+    This demonstrates wave nature of particles.""",
+    "box.potentials": {"Finite well": "finite_well", "Step barrier (tunnelling)": "barrier",
+                       "Harmonic trap": "harmonic", "Custom shape": "custom"},
+    "box.mode": "Initial state",
+    "box.modes": {"Two-state superposition": "superposition", "Gaussian wave packet": "packet",
+                  "Packet in a potential": "potential"},
+    "box.n1": "State n₁",
+    "box.n2": "State n₂",
+    "box.amp": "Amplitude of ψ₂",
+    "box.x0": "Packet centre x₀/L",
+    "box.sigma": "Packet width σ/L",
+    "box.n0": "Mean quantum number n₀",
+    "box.n_states": "Eigenstates kept N",
+    "box.packet_info": "The packet is expanded in N eigenstates ψₙ and evolved over two classical round trips.",
+    "box.potential": "Potential V(x)",
+    "box.V0": "Height V₀ (units of E₁)",
+    "box.shape": "Shape: values 0–1 across the box, comma-separated",
+    "box.shape_error": "Could not read the shape; using a flat potential.",
+    "box.width": "Width w/L",
+    "box.potential_info": ("Packet energy ≈ n₀² = {E0} E₁. The potential (grey, scaled to its maximum) is solved "
+                           "numerically on a grid, not expanded in eigenstates."),
+    "box.play": "Play Time Evolution",
+    "box.pause": "Pause",
+
+    # Key Equations
+    "eq.title": "Key Equations — Krane",
+
+    # Static export (ui/export.py)
+    "static.note": ("Static edition: these charts run entirely in your browser. "
+                    "Controls not shown here keep the live app's defaults, except the spacetime "
+                    "diagram, which draws 200 random events instead of 2000."),
+}
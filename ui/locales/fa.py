@@ -0,0 +1,158 @@
+"""رشته‌های فارسی (Persian strings)."""
+
+STRINGS = {
+    "language": "فارسی",
+    "rtl": True,
+    "music": False,
+    "cover_pdf": "فیزیک جدید کرین.pdf",
+    "page_title": "شبیه‌ساز فیزیک جدید — محمد ایمانی",
+    "header.title": "شبیه‌ساز تعاملی فیزیک جدید",
+    "header.byline": "<b>محمد ایمانی</b> — کرین، ویرایش دوم",
+    "cover_error": "خطا در استخراج جلد: {error}",
+    "sidebar.title": "فصل‌ها",
+    "chapters": {
+        "مقدمه": "intro",
+        "۱ — نسبیت خاص": "relativity",
+        "۲ — اثر فوتوالکتریک": "photoelectric",
+        "۳ — تداخل دو شکاف": "double_slit",
+        "۴ — مدل بور": "bohr",
+        "۵ — ذره در جعبه": "box",
+        "معادلات کلیدی": "equations",
+    },
+    "lesson": "درسنامه:",
+    "equations": "معادلات:",
+    "key_equations": "معادلات کلیدی:",
+    "unit.ev": "الکترون‌ولت",
+
+    # مقدمه
+    "intro.title": "مقدمه",
+    "intro.body": """این برنامه تعاملی، مفاهیم کلیدی کتاب <b>فیزیک جدید</b> نوشته کنت اس. کرین (ویرایش دوم، ترجمه منیژه رهبر و بهرام معلمی) را شبیه‌سازی می‌کند.
+    هر فصل شامل موارد زیر است:
+    <ul>
+        <li>درسنامه کامل (حداقل پنج خط)</li>
+        <li>کنترل‌های تعاملی با توضیحات لحظه‌ای</li>
+        <li>نمودارهای باکیفیت</li>
+        <li>معادلات دقیق کتاب</li>
+    </ul>""",
+    "intro.credits": """<b>دانشکده فیزیک، دانشگاه زنجان</b><br><br>
+    با تشکر ویژه از:<br>
+    <b>دکتر رضا رسولی</b> — عضو هیئت علمی دانشگاه زنجان<br>
+    <b>دکتر مجتبی نصیری</b> — مدیرگروه دانشکده فیزیک دانشگاه زنجان""",
+
+    # ۱ — نسبیت خاص
+    "rel.title": "فصل ۱ — نسبیت خاص",
+    "rel.lesson": """نسبیت خاص اینشتین نشان می‌دهد که فضا و زمان مطلق نیستند. در سرعت‌های نزدیک به سرعت نور، طول در جهت حرکت کوتاه می‌شود، زمان کندتر می‌گذرد و جرم افزایش می‌یابد. این اثرات تنها در سرعت‌های بالاتر از یک‌دهم سرعت نور قابل توجه هستند.<br><br>
+    دو اصل اساسی: ۱) قوانین فیزیک در تمام چارچوب‌های اینرسی یکسان است. ۲) سرعت نور در خلأ برای همه ناظران ثابت است (۳×۱۰⁸ متر بر ثانیه).""",
+    "rel.presets": {"میله متحرک": "rod", "نردبان در انبار": "ladder", "پارادوکس دوقلوها": "twin"},
+    "rel.frames": {"چارچوب سکون S": "rest", "چارچوب متحرک S′": "moving"},
+    "rel.v": "نسبت سرعت به سرعت نور",
+    "rel.L0": "طول اصلی (متر)",
+    "rel.result": "γ = <span style='{var}'>{gamma:.4f}</span> | طول = <span style='{var}'>{L:.2f} متر</span>",
+    "rel.negligible": "اثر نسبیتی ناچیز",
+    "rel.significant": "کوتاه‌شدگی قابل توجه",
+    "rel.near_c": "نزدیک سرعت نور! γ بزرگ‌تر از ۲",
+    "rel.scenario": "سناریو",
+    "rel.draw_in": "رسم در",
+    "rel.events": "رویدادهای زمینه",
+    "rel.rod.names": ("میله ساکن", "میله متحرک"),
+    "rel.rod.caption": ("در چارچوب S دو سر میله متحرک در ct = 0 به فاصله L₀/γ = {L:.2f} متر از هم هستند. "
+                        "خط‌چین‌ها رویدادهایی را که هر چارچوب هم‌زمان می‌داند به هم وصل می‌کنند."),
+    "rel.ladder.names": ("درهای انبار", "دو سر نردبان"),
+    "rel.ladder.fits": "جا می‌شود",
+    "rel.ladder.does_not_fit": "جا نمی‌شود",
+    "rel.ladder.caption": ("طول انبار: {barn:.1f} متر. در چارچوب انبار نردبان {L:.2f} متری {fits} وقتی هر دو در "
+                           "در ct = 0 بسته می‌شوند؛ در چارچوب نردبان طول انبار {barn_moving:.2f} متر است و درها "
+                           "هم‌زمان بسته نمی‌شوند."),
+    "rel.twin.names": ("دوقلوی ماندگار", "دوقلوی مسافر"),
+    "rel.twin.caption": ("دوقلوی ماندگار {home:.1f} متر/c پیر می‌شود و مسافر {traveller:.1f} متر/c. "
+                         "خط‌چین‌ها پرش «اکنون» مسافر را هنگام بازگشت نشان می‌دهند."),
+    "rel.ticks": ("نقطه‌ها هر {step:g} متر/c از زمان ویژه را نشان می‌دهند؛ رویدادهای زمینه درون مخروط نوری مبدأ سبز "
+                  "و بیرون آن خاکستری‌اند و این در همه چارچوب‌ها یکسان است."),
+    "rel.simultaneity": "هم‌زمانی",
+    "rel.key_events": "رویدادهای کلیدی",
+
+    # ۲ — اثر فوتوالکتریک
+    "pe.title": "فصل ۲ — اثر فوتوالکتریک",
+    "pe.lesson": """اینشتین نشان داد نور به صورت فوتون با انرژی E = h f است. اگر انرژی فوتون از کارکرد φ بیشتر باشد، الکترون‌ها خارج می‌شوند. حداکثر انرژی جنبشی: K_max = h f - φ.<br><br>
+    نکته کلیدی: شدت نور تعداد فوتون‌ها (جریان) را تغییر می‌دهد، نه انرژی آن‌ها. K_max تنها به بسامد بستگی دارد.""",
+    "pe.freq": "بسامد (×۱۰¹⁴ هرتز)",
+    "pe.phi": "کارکرد φ (الکترون‌ولت)",
+    "pe.result": ("انرژی = <span style='{var}'>{E:.3f} الکترون‌ولت</span> | "
+                  "K_max = <span style='{var}'>{Kmax:.3f} الکترون‌ولت</span>"),
+    "pe.emitted": "الکترون‌ها خارج می‌شوند",
+    "pe.below": "زیر آستانه",
+    "pe.power": "توان نور (نانووات)",
+    "pe.photocurrent": ("{n_photons:,} فوتون در ۱ میلی‌ثانیه → {n_emitted:,} الکترون گسیل شد. جریان در "
+                        "V = −{V_stop:.2f} V صفر می‌شود؛ پتانسیل توقف ایدئال −K_max/e = −{Kmax:.2f} V است (خط‌چین)."),
+
+    # ۳ — تداخل دو شکاف
+    "ds.title": "فصل ۳ — تداخل دو شکاف",
+    "ds.lesson": """آزمایش یانگ ثابت کرد نور موج است. دو شکاف به عنوان منابع همدوس عمل می‌کنند. اختلاف مسیر تعیین‌کننده تداخل سازنده یا مخرب است. نوارهای روشن در اختلاف مسیر برابر با طول موج‌های صحیح، نوارهای تاریک در اختلاف مسیر برابر با نیم‌طول موج.<br><br>
+    فاصله نوارها تقریباً برابر است با طول موج × فاصله صفحه / فاصله شکاف‌ها. افزایش فاصله شکاف یا کاهش طول موج، فاصله نوارها را کم می‌کند.""",
+    "ds.sources": {"تک‌رنگ (طول موج انتخابی)": "mono", "نور سفید ۴۰۰ تا ۷۰۰ نانومتر": "white",
+                   "دوتایی سدیم": "sodium", "خطوط بالمر هیدروژن": "hydrogen"},
+    "ds.d": "فاصله شکاف‌ها (میلی‌متر)",
+    "ds.lam": "طول موج (نانومتر)",
+    "ds.L": "فاصله صفحه (متر)",
+    "ds.N": "تعداد شکاف‌ها",
+    "ds.a": "پهنای شکاف (میکرومتر، صفر = شکاف نقطه‌ای)",
+    "ds.source": "چشمه نور",
+    "ds.h": "ارتفاع شکاف (میکرومتر)",
+    "ds.view": "نمایش",
+    "ds.views": {"الگوی موجی": "wave", "فوتون به فوتون": "photons"},
+    "ds.screen": "پرده آزمایش همان‌گونه که در آزمایشگاه دیده می‌شود",
+    "ds.reset": "پاک کردن",
+    "ds.detected": "{total:,} فوتون آشکار شد؛ منحنی قرمز شمار مورد انتظار برای الگوی فعلی است.",
+
+    # ۴ — مدل بور
+    "bohr.title": "فصل ۴ — مدل بور",
+    "bohr.lesson": """بور پیشنهاد کرد الکترون‌ها در مدارهای کوانتیده با شعاع r_n = n² a_0 حرکت می‌کنند. سطوح انرژی: E_n = -13.6/n² الکترون‌ولت. گذارها فوتون منتشر یا جذب می‌کنند با hν = |E_i - E_f|.<br><br>
+    این مدل طیف هیدروژن را توضیح می‌دهد و پارادوکس فروپاشی کلاسیک را حل می‌کند.""",
+    "bohr.series": {1: "لیمان", 2: "بالمر", 3: "پاشن", 4: "براکت", 5: "فوند", 6: "هامفریز"},
+    "bohr.n_max": "بالاترین تراز",
+    "bohr.n_f_max": "رشته‌های نمایش‌داده‌شده (تراز نهایی تا)",
+    "bohr.n1": "حالت اولیه",
+    "bohr.n2": "حالت نهایی",
+    "bohr.no_transition": "بدون گذار",
+    "bohr.emission": "گسیل",
+    "bohr.absorption": "جذب",
+    "bohr.photon": "طول موج = <span style='{var}'>{lam_nm:.1f} نانومتر</span> ({kind}، رشته {series})",
+    "bohr.result": ("شعاع = <span style='{var}'>{r:.1f} آنگستروم</span> | "
+                    "ΔE = <span style='{var}'>{dE:.3f} الکترون‌ولت</span> | {photon}"),
+    "bohr.lines": "{n_lines} خط گسیلی از {n_max} تراز رسم شده است",
+
+    # ۵ — ذره در جعبه
+    "box.title": "فصل ۵ — ذره در جعبه بی‌نهایت",
+    "box.lesson": """ذره در جعبه بی‌نهایت تنها می‌تواند طول موج‌هایی داشته باشد که در جعبه جا شوند: λ_n = 2L/n. این منجر به انرژی کوانتیده E_n ∝ n² می‌شود. سوپرپوزیشن دو حالت با n متفاوت، چگالی احتمال وابسته به زمان ایجاد می‌کند.<br><br>
+    این پدیده ماهیت موجی ذرات را نشان می‌دهد.""",
+    "box.potentials": {"چاه متناهی": "finite_well", "سد پتانسیل (تونل‌زنی)": "barrier",
+                       "تله هماهنگ": "harmonic", "شکل دلخواه": "custom"},
+    "box.mode": "حالت اولیه",
+    "box.modes": {"برهم‌نهی دو حالت": "superposition", "بسته موج گاوسی": "packet",
+                  "بسته در پتانسیل": "potential"},
+    "box.n1": "حالت یک",
+    "box.n2": "حالت دو",
+    "box.amp": "دامنه حالت دو",
+    "box.x0": "مرکز بسته (x₀/L)",
+    "box.sigma": "پهنای بسته (σ/L)",
+    "box.n0": "عدد کوانتومی میانگین n₀",
+    "box.n_states": "تعداد ویژه‌حالت‌ها N",
+    "box.packet_info": "بسته موج بر حسب N ویژه‌حالت ψₙ بسط داده شده و در دو رفت‌وبرگشت کلاسیک تحول می‌یابد.",
+    "box.potential": "پتانسیل V(x)",
+    "box.V0": "ارتفاع V₀ (بر حسب E₁)",
+    "box.shape": "شکل: مقادیر ۰ تا ۱ در طول جعبه، جداشده با ویرگول",
+    "box.shape_error": "شکل خوانده نشد؛ پتانسیل صاف در نظر گرفته شد.",
+    "box.width": "پهنا (w/L)",
+    "box.potential_info": ("انرژی بسته ≈ n₀² = {E0} E₁. پتانسیل (خاکستری، مقیاس‌شده به بیشینه) به روش عددی روی "
+                           "شبکه حل می‌شود، نه با بسط ویژه‌حالت‌ها."),
+    "box.play": "پخش تکامل زمانی",
+    "box.pause": "توقف",
+
+    # معادلات کلیدی
+    "eq.title": "معادلات کلیدی — کرین",
+
+    # Static export (ui/export.py)
+    "static.note": ("نسخه‌ی ایستا: این نمودارها کاملاً در مرورگر شما اجرا می‌شوند. "
+                    "کنترل‌هایی که اینجا نیستند، مقدار پیش‌فرض برنامه‌ی زنده را دارند؛ "
+                    "به‌جز نمودار فضا-زمان که به‌جای ۲۰۰۰ رویداد تصادفی، ۲۰۰ رویداد رسم می‌کند."),
+}
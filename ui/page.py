@@ -0,0 +1,116 @@
+"""Styles, HTML blocks and equations shared by the chapter pages in ``chapters/``.
+
+The HTML builders return strings so the static export (``ui/export.py``)
+renders the same header, lesson boxes and equations as the app.
+"""
+import streamlit as st
+
+from ui import trace
+
+VAR = "color:#87cefa; font-weight:bold;"
+
+# LaTeX under each lesson, keyed by catalog section; ``{ev}`` is replaced by the catalog's electron-volt unit.
+EQUATIONS = {
+    "rel": (r"\gamma = \frac{1}{\sqrt{1 - \frac{v^2}{c^2}}}", r"L = \frac{L_0}{\gamma}", r"\Delta t = \gamma \Delta \tau"),
+    "pe": (r"E = h f", r"K_{max} = h f - \phi"),
+    "ds": (r"\Delta = d \sin\theta \approx \frac{d x}{L}", r"\Delta x = \frac{\lambda L}{d}",
+           r"I(\theta) = \mathrm{sinc}^2\!\left(\frac{a \sin\theta}{\lambda}\right) \left[\frac{\sin(N\gamma)}{N \sin\gamma}\right]^2, \quad \gamma = \frac{\pi d \sin\theta}{\lambda}"),
+    "bohr": (r"r_n = n^2 a_0", r"E_n = -\frac{13.6}{n^2} \text{ {ev}}"),
+    "box": (r"\psi_n(x) = \sqrt{\frac{2}{L}} \sin\left(\frac{n\pi x}{L}\right)", r"E_n \propto n^2"),
+    "eq": (r"\gamma = \frac{1}{\sqrt{1 - v^2/c^2}}", r"K_{max} = h f - \phi", r"\Delta x = \frac{\lambda L}{d}",
+           r"E_n = -\frac{13.6}{n^2} \text{ {ev}}", r"\psi_n(x) = \sqrt{\frac{2}{L}} \sin\left(\frac{n\pi x}{L}\right)"),
+}
+
+
+def box_style(T):
+    """Lesson/result box; the accent border sits on the reading-start side."""
+    return (f"background:#1a2a44; padding:18px; border-radius:10px; border-{'right' if T['rtl'] else 'left'}:5px solid #4a9eff; "
+            "margin:15px 0; color:#e6f2ff; line-height:1.8;")
+
+
+def header_html(T):
+    return f"""
+    <div style="text-align:center; background: linear-gradient(90deg, #0b1a33, #0f2a55); padding:20px; border-radius:12px; box-shadow:0 6px 20px rgba(0,0,0,0.5);">
+    <h1 style="color:#e6f2ff; margin:0; font-family:'Georgia', serif;">{T["header.title"]}</h1>
+    <p style="color:#a8c8e8; margin:8px 0 0 0; font-size:19px;">
+    {T["header.byline"]}
+    </p>
+    </div>
+    """
+
+
+def title_html(text, center=False):
+    align = " text-align:center;" if center else ""
+    return f"<h2 style='color:#4a9eff;{align}'>{text}</h2>"
+
+
+def title(text, center=False):
+    st.markdown(title_html(text, center), unsafe_allow_html=True)
+
+
+def intro_html(T):
+    """The introduction below its title: the poem, the body box and the credits."""
+    return f"""
+    <div style="text-align:center; margin:30px 0; font-family:'Noto Nastaliq Urdu', serif; font-size:28px; color:#ffd700; line-height:2;">
+    همه عمر بر ندارم سر از این خمار مستی<br>
+    که هنوز من نبودم که تو بر دلم نشستی
+    </div>
+    <div style='{box_style(T)}'>
+    {T["intro.body"]}
+    </div>
+    <div style="text-align:center; margin-top:40px; color:#a8c8e8; font-size:14px;">
+    {T["intro.credits"]}
+    </div>
+    """
+
+
+def lesson_html(T, key, heading="equations"):
+    return f"""
+    <div style='{box_style(T)}'>
+    <b>{T["lesson"]}</b><br>
+    {T[key + ".lesson"]}<br><br>
+    <b>{T[heading]}</b><br>
+    </div>
+    """
+
+
+def lesson(T, key, heading="equations"):
+    """The chapter title and its lesson box, ending with the equations heading."""
+    title(T[key + ".title"])
+    st.markdown(lesson_html(T, key, heading), unsafe_allow_html=True)
+
+
+def latex(T, key):
+    return [eq.replace("{ev}", T["unit.ev"]) for eq in EQUATIONS[key]]
+
+
+def equations(T, key):
+    for eq in latex(T, key):
+        st.latex(eq)
+
+
+def result_html(T, html):
+    return f"<div style='{box_style(T)}'>{html}</div>"
+
+
+def result(T, html):
+    st.markdown(result_html(T, html), unsafe_allow_html=True)
+
+
+def chart(fig):
+    """Draw ``fig`` full-width and charge its trace payload to the panel's budget (see ``ui.trace``)."""
+    from ui import figures
+
+    st.plotly_chart(fig, use_container_width=True)
+    trace.charge(figures.payload_bytes(fig))
+
+
+def panel(chapter):
+    """Decorator running a chapter's controls and charts as one ``st.fragment``.
+
+    A widget inside the panel reruns only the panel: the header, navigation,
+    lesson box and equations are neither re-executed nor re-sent.
+    """
+    def decorate(fn):
+        return st.fragment(trace.fragment(fn, chapter))
+    return decorate
@@ -0,0 +1,40 @@
+"""Server-side raster images for chapter charts.
+
+Large 2D fields (the interference screen) are rendered to a fixed-size WebP
+once per parameter tuple and shipped as a single base64 image layer under
+Plotly axes. The payload depends on the pixel size, not on how finely the
+physics had to be sampled: a 900×240 fringe image is ~20 KB, where the
+equivalent heatmap JSON would be megabytes (and lossless PNG ~100 KB).
+"""
+import base64
+from io import BytesIO
+
+import numpy as np
+import streamlit as st
+
+from physics import diffraction, kernels
+
+
+def image_data_uri(rgb, gamma=2.2, quality=85):
+    """Encode a float image in [0, 1], shaped (h, w, 3), as a ``data:image/webp`` URI.
+
+    Rows are flipped so row 0 of ``rgb`` (smallest y) lands at the bottom.
+    """
+    from PIL import Image
+
+    pixels = (np.clip(rgb, 0, 1) ** (1 / gamma) * 255 + 0.5).astype(np.uint8)[::-1]
+    buf = BytesIO()
+    Image.fromarray(pixels, "RGB").save(buf, format="WEBP", quality=quality)
+    return "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+@st.cache_data(**kernels.CACHE)
+def interference_screen(d_mm, lam_nm, L, a_um=0.0, N=2, source="mono", h_um=100,
+                        half_width_m=0.05, half_height_m=0.01, width_px=900, height_px=240):
+    """WebP data URI of the lit screen for the chapter 3 parameters."""
+    lam, weights = diffraction.spectrum(source, lam_nm)
+    d = d_mm * 1e-3
+    x = kernels.grating_grid(lam, d, L, N, half_width_m)
+    y = np.linspace(-half_height_m, half_height_m, height_px)
+    rgb = diffraction.screen_rgb(x, y, lam * 1e-9, weights, d, a_um * 1e-6, h_um * 1e-6, N, L, width_px)
+    return image_data_uri(rgb)
@@ -0,0 +1,272 @@
+"""Opt-in per-rerun timing spans with a JSONL trace log.
+
+Tracing is off unless ``MODERN_PHYSICS_TRACE=1`` is set in the server's
+environment or the page is opened with ``?trace=1``. When it is on, a rerun
+is split into spans:
+
+* ``header`` and ``sidebar`` — the app calls ``mark()`` after each block;
+* ``compute`` — calls into ``physics.kernels``, ``physics.photons`` and
+  ``ui.raster``, with their scalar arguments kept as the rerun's parameters;
+* ``figure`` — calls into ``ui.figures`` builders;
+* ``plotly_chart`` — ``st.plotly_chart`` itself (serialization and send);
+* ``chapter`` — everything after the sidebar, including the three above.
+
+A slider inside a chapter panel reruns only that ``st.fragment`` (see
+``ui.page.panel``); ``fragment()`` traces those partial reruns as their own
+records, marked ``"rerun": "fragment"``, with no header or sidebar spans.
+
+``finish()`` shows the breakdown in a sidebar panel and appends one JSON
+record per rerun (session id, chapter, parameters, span ms, chart payload
+bytes, language) to ``MODERN_PHYSICS_TRACE_LOG`` (default ``.cache/trace.jsonl``).
+
+Independently of tracing, every panel run keeps a payload ledger: charts
+drawn through ``ui.page.chart`` ``charge()`` their estimated trace data
+size, and the first chart that takes the run past
+``MODERN_PHYSICS_PAYLOAD_BUDGET`` KiB (default 512, ``0`` turns it off)
+logs a server-side warning.
+
+The module wrappers are installed the first time any session enables
+tracing. The current rerun's tracer is a context variable, so sessions
+that are not tracing only pay for one lookup per wrapped call.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+from ui.assets import ROOT
+
+ENV_FLAG = "MODERN_PHYSICS_TRACE"
+ENV_LOG = "MODERN_PHYSICS_TRACE_LOG"
+DEFAULT_LOG = ROOT / ".cache" / "trace.jsonl"
+ENV_BUDGET = "MODERN_PHYSICS_PAYLOAD_BUDGET"
+DEFAULT_BUDGET_KIB = 512
+
+_LOGGER = get_logger(__name__)
+_current = contextvars.ContextVar("modern_physics_trace", default=None)
+_payload = contextvars.ContextVar("modern_physics_payload", default=None)
+_install_lock = threading.Lock()
+_write_lock = threading.Lock()
+_installed = False
+_SCALARS = (bool, int, float, str, type(None))
+
+
+def enabled():
+    if os.environ.get(ENV_FLAG, "") not in ("", "0"):
+        return True
+    return st.query_params.get("trace") == "1"
+
+
+class Rerun:
+    """Span totals for one script run. Nested spans only count the outermost one."""
+
+    def __init__(self):
+        self.start = self.last_mark = time.perf_counter()
+        self.spans = defaultdict(float)
+        self.params = {}
+        self.charts = 0
+        self.payload_bytes = 0
+        self._depth = 0
+
+    @contextmanager
+    def span(self, name):
+        if self._depth:
+            yield
+            return
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] += time.perf_counter() - start
+            self._depth -= 1
+
+
+def _is_param(value):
+    return isinstance(value, _SCALARS) or (isinstance(value, tuple) and all(isinstance(v, _SCALARS) for v in value))
+
+
+def _params(args, kwargs):
+    """The call's scalar arguments (slider values); arrays and other objects are dropped."""
+    return [a for a in args if _is_param(a)] + [f"{k}={v}" for k, v in kwargs.items() if _is_param(v)]
+
+
+def _traced(bucket, name, fn, record_params=False):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        tracer = _current.get()
+        if tracer is None:
+            return fn(*args, **kwargs)
+        if record_params and not tracer._depth:
+            tracer.params[name] = _params(args, kwargs)
+        with tracer.span(bucket):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _traced_chart(fn):
+    @functools.wraps(fn)
+    def plotly_chart(figure_or_data, *args, **kwargs):
+        tracer = _current.get()
+        if tracer is None:
+            return fn(figure_or_data, *args, **kwargs)
+        with tracer.span("plotly_chart"):
+            result = fn(figure_or_data, *args, **kwargs)
+        # Re-serializing costs as much again, so it happens outside the span and only while tracing.
+        import plotly.io as pio
+
+        spec = figure_or_data.to_dict() if hasattr(figure_or_data, "to_dict") else figure_or_data
+        tracer.charts += 1
+        tracer.payload_bytes += len(pio.to_json(spec, validate=False))
+        return result
+    return plotly_chart
+
+
+def _install():
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from physics import kernels, photons
+        from ui import figures, raster
+
+        for bucket, module in (("compute", kernels), ("compute", photons), ("compute", raster),
+                               ("figure", figures)):
+            for name, obj in list(vars(module).items()):
+                if name.startswith("_") or isinstance(obj, type) or not callable(obj):
+                    continue
+                if getattr(obj, "__module__", None) == module.__name__:
+                    setattr(module, name, _traced(bucket, name, obj, record_params=bucket == "compute"))
+        st.plotly_chart = _traced_chart(st.plotly_chart)
+        _installed = True
+
+
+def start():
+    """Begin tracing this rerun when enabled; returns the ``Rerun`` or None."""
+    if not enabled():
+        _current.set(None)
+        return None
+    _install()
+    tracer = Rerun()
+    _current.set(tracer)
+    return tracer
+
+
+def mark(name):
+    """Record the time since the previous mark (or the start) as span ``name``; a no-op when not tracing."""
+    tracer = _current.get()
+    if tracer is not None:
+        now = time.perf_counter()
+        tracer.spans[name] += now - tracer.last_mark
+        tracer.last_mark = now
+
+
+def _session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def _write(record):
+    path = Path(os.environ.get(ENV_LOG) or DEFAULT_LOG)
+    line = json.dumps(record, ensure_ascii=False)
+    with _write_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def budget_bytes():
+    """The per-run chart payload budget in bytes, or 0 when it is disabled."""
+    try:
+        return max(0, int(float(os.environ.get(ENV_BUDGET, DEFAULT_BUDGET_KIB)) * 1024))
+    except ValueError:
+        return DEFAULT_BUDGET_KIB * 1024
+
+
+class Payload:
+    """Chart payload sent by one panel run, against the budget."""
+
+    def __init__(self, chapter):
+        self.chapter = chapter
+        self.bytes = 0
+        self.charts = 0
+        self.warned = False
+
+
+def charge(nbytes):
+    """Add one chart's payload to the current panel run; warn once if the run goes over budget."""
+    ledger = _payload.get()
+    if ledger is None:
+        return
+    ledger.bytes += nbytes
+    ledger.charts += 1
+    budget = budget_bytes()
+    if budget and ledger.bytes > budget and not ledger.warned:
+        ledger.warned = True
+        _LOGGER.warning("%s: chart %d took this run's figure payload to %.1f KiB, over the %.0f KiB budget (%s)",
+                        ledger.chapter, ledger.charts, ledger.bytes / 1024, budget / 1024, ENV_BUDGET)
+
+
+def fragment(fn, chapter):
+    """Wrap a fragment body so its fragment-only reruns are traced; inside a full rerun it just runs.
+
+    Every run of the body, full or fragment-only, gets a fresh payload ledger.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _payload.set(Payload(chapter))
+        try:
+            if _current.get() is not None or not enabled():
+                return fn(*args, **kwargs)
+            tracer = Rerun()
+            _current.set(tracer)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finish(tracer, chapter, partial=True)
+        finally:
+            _payload.reset(token)
+    return wrapper
+
+
+def finish(tracer, chapter, script=None, partial=False):
+    """Close the rerun: log its record and show the breakdown in the sidebar.
+
+    ``script`` is the app's ``__file__``; the record also keeps the session's
+    language. A ``partial`` (fragment) rerun is only logged: a fragment
+    cannot draw into the sidebar.
+    """
+    if tracer is None:
+        return
+    _current.set(None)
+    total = time.perf_counter() - tracer.start
+    spans = dict(tracer.spans)
+    spans["chapter"] = total - spans.get("header", 0.0) - spans.get("sidebar", 0.0)
+    spans["total"] = total
+    record = dict(
+        ts=datetime.now(timezone.utc).isoformat(timespec="milliseconds"), session=_session_id(),
+        app=Path(script).name if script else None, locale=st.session_state.get("locale"),
+        rerun="fragment" if partial else "full",
+        chapter=chapter, params=tracer.params, spans_ms={k: round(v * 1e3, 3) for k, v in spans.items()},
+        charts=tracer.charts, payload_bytes=tracer.payload_bytes,
+    )
+    _write(record)
+    if partial:
+        return
+
+    with st.sidebar.expander("Trace", expanded=True):
+        order = ("header", "sidebar", "chapter", "compute", "figure", "plotly_chart", "total")
+        rows = [f"| {name} | {record['spans_ms'][name]:.1f} |" for name in order if name in record["spans_ms"]]
+        st.markdown("| span | ms |\n|---|---:|\n" + "\n".join(rows))
+        st.caption(f"{tracer.charts} charts, {tracer.payload_bytes / 1024:.1f} KiB of Plotly JSON")